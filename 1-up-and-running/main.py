@@ -1,8 +1,14 @@
 from fastapi import FastAPI
 from pydantic import BaseModel
 import re
+from functools import lru_cache
 from typing import List, Tuple, Optional
 
+try:
+    import ahocorasick
+except ImportError:  # no wheel for this platform: use the precompiled regexes below
+    ahocorasick = None
+
 app = FastAPI()
 
 
@@ -11,7 +17,22 @@ class TextInput(BaseModel):
 
 
 # Tokenizer: include lettere danesi, apostrofi ASCII+unicode, e trattini
-WORD_RE = re.compile(r"[a-zA-ZæøåÆØÅ'’\-]+")
+WORD_CHARS = set("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZæøåÆØÅ'’-")
+
+
+class TokenTable(dict):
+    """
+    str.translate table for the word class [a-zA-ZæøåÆØÅ'’-]:
+    word chars map to themselves, everything else to a space.
+    Explicit up to the end of General Punctuation (covers "—", "…" etc.);
+    any higher code point is never a word char.
+    """
+
+    def __missing__(self, cp: int) -> str:
+        return " "
+
+
+TOKEN_TABLE = TokenTable({cp: (cp if chr(cp) in WORD_CHARS else " ") for cp in range(0x2070)})
 
 # --- Lexicons / phrases ------------------------------------------------------
 
@@ -87,15 +108,73 @@ POS_PHRASES = sorted(set(normalize_space(p.lower()) for p in POS_PHRASES_RAW))
 NEG_PHRASES = sorted(set(normalize_space(p.lower()) for p in NEG_PHRASES_RAW))
 NEU_PHRASES = sorted(set(normalize_space(p.lower()) for p in NEU_PHRASES_RAW))
 
+# Category weights for phrase hits (neutral has no weight: it short-circuits)
+PHRASE_CATEGORIES = (("neu", NEU_PHRASES, 0.0), ("pos", POS_PHRASES, 2.0), ("neg", NEG_PHRASES, 2.5))
+
+
+def build_phrase_automaton() -> Optional["ahocorasick.Automaton"]:
+    """
+    One Aho-Corasick automaton over all phrases, built once at import.
+    Value per phrase: (phrase, category, weight, needs_word_boundary).
+    Same rule as phrase_hit: hyphen/apostrophe phrases match as plain substrings.
+    """
+    if ahocorasick is None:
+        return None
+    A = ahocorasick.Automaton()
+    for cat, phrases, weight in PHRASE_CATEGORIES:
+        for p in phrases:
+            A.add_word(p, (p, cat, weight, not any(ch in p for ch in "-'")))
+    A.make_automaton()
+    return A
+
+
+PHRASE_AUTOMATON = build_phrase_automaton()
+
+# \w membership for the whole BMP, for the automaton's boundary checks:
+# one byte lookup instead of str.isalnum() + "_" comparison per check
+WORD_CHR = bytes(1 if (chr(i).isalnum() or i == 0x5F) else 0 for i in range(0x10000))
+
+
+def compile_phrase_group(phrases: List[str]) -> Tuple[Optional[re.Pattern], List[re.Pattern], List[str]]:
+    """
+    Fallback without the automaton, compiled once instead of once per call:
+    - one \b-alternation over all word-bounded phrases (single pass, used as prefilter)
+    - the per-phrase regexes, only consulted when the alternation hits
+    - hyphen/apostrophe phrases as plain substrings
+    """
+    wb = [p for p in phrases if not any(ch in p for ch in "-'")]
+    sub = [p for p in phrases if any(ch in p for ch in "-'")]
+    combined = re.compile(r"\b(?:" + "|".join(map(re.escape, wb)) + r")\b") if wb else None
+    singles = [re.compile(rf"\b{re.escape(p)}\b") for p in wb]
+    return combined, singles, sub
+
+
+PHRASE_GROUPS = {cat: compile_phrase_group(phrases) for cat, phrases, _ in PHRASE_CATEGORIES}
+PHRASE_WEIGHTS = {cat: weight for cat, _, weight in PHRASE_CATEGORIES}
+
 POS_WORDS = set(w.lower().replace("’", "'") for w in POS_WORDS_RAW)
 NEG_WORDS = set(w.lower().replace("’", "'") for w in NEG_WORDS_RAW)
+NEUTRAL_TOKENS = {"ok", "okay", "fine", "fint"}
+
+# Token classes as bit flags: one dict lookup per token in score_segment.
+# Flags, not ids, because a word can sit in several lexicons (e.g. "mega").
+T_NEGATION, T_INTENSIFIER, T_POS, T_NEG, T_NEUTRAL = 1, 2, 4, 8, 16
+TOKEN_CLASS = {}
+for flag, words in ((T_NEGATION, NEGATION_WORDS), (T_INTENSIFIER, INTENSIFIERS),
+                    (T_POS, POS_WORDS), (T_NEG, NEG_WORDS), (T_NEUTRAL, NEUTRAL_TOKENS)):
+    for w in words:
+        TOKEN_CLASS[w] = TOKEN_CLASS.get(w, 0) | flag
 
 
 # --- Helpers -----------------------------------------------------------------
 
 def tokenize(s: str) -> List[str]:
-    s = normalize_space(s.lower())
-    return WORD_RE.findall(s)
+    return split_tokens(normalize_space(s.lower()))
+
+
+def split_tokens(s: str) -> List[str]:
+    # s already lowercased + normalized; translate + split instead of a regex findall
+    return s.translate(TOKEN_TABLE).split()
 
 
 def quantize_label(raw_score: float) -> int:
@@ -118,6 +197,60 @@ def phrase_hit(phrase: str, s: str) -> bool:
     return re.search(rf"\b{re.escape(phrase)}\b", s) is not None
 
 
+def is_word_char(ch: str) -> bool:
+    # same definition as \w in re (unicode): alphanumeric or underscore
+    o = ord(ch)
+    if o < 0x10000:
+        return WORD_CHR[o] == 1
+    return ch.isalnum()
+
+
+def count_phrase_group(cat: str, s: str) -> int:
+    combined, singles, sub = PHRASE_GROUPS[cat]
+    n = sum(1 for p in sub if p in s)
+    if combined is not None and combined.search(s):
+        n += sum(1 for r in singles if r.search(s))
+    return n
+
+
+def phrase_hits_re(s: str) -> Tuple[bool, float, float]:
+    combined, _, sub = PHRASE_GROUPS["neu"]
+    if (combined is not None and combined.search(s)) or any(p in s for p in sub):
+        return True, 0.0, 0.0
+    pos = PHRASE_WEIGHTS["pos"] * count_phrase_group("pos", s)
+    neg = PHRASE_WEIGHTS["neg"] * count_phrase_group("neg", s)
+    return False, pos, neg
+
+
+def phrase_hits(s: str) -> Tuple[bool, float, float]:
+    """
+    Single pass over s with PHRASE_AUTOMATON (or the regex fallback).
+    Returns (neutral_hit, pos, neg); each distinct phrase counts once, like phrase_hit.
+    """
+    if PHRASE_AUTOMATON is None:
+        return phrase_hits_re(s)
+    seen = set()
+    pos = 0.0
+    neg = 0.0
+    for end, (p, cat, weight, wb) in PHRASE_AUTOMATON.iter(s):
+        if p in seen:
+            continue
+        if wb:
+            start = end - len(p) + 1
+            if start > 0 and is_word_char(s[start - 1]):
+                continue
+            if end + 1 < len(s) and is_word_char(s[end + 1]):
+                continue
+        if cat == "neu":
+            return True, 0.0, 0.0
+        seen.add(p)
+        if cat == "pos":
+            pos += weight
+        else:
+            neg += weight
+    return False, pos, neg
+
+
 def split_on_contrast(s: str) -> Optional[Tuple[str, str]]:
     """
     Split on common contrast markers (but/men/however/dog).
@@ -136,31 +269,36 @@ def score_segment(text: str) -> float:
     Score a segment without doing contrast-splitting again.
     Returns a continuous score (pos - neg).
     """
-    s = normalize_space(text.lower())
-
-    # 0) Explicit neutral phrases override
-    for p in NEU_PHRASES:
-        if phrase_hit(p, s):
-            return 0.0
+    return score_normalized(normalize_space(text.lower()))
 
-    pos = 0.0
-    neg = 0.0
 
-    # 1) Phrase-level signals
-    for p in POS_PHRASES:
-        if phrase_hit(p, s):
-            pos += 2.0
-    for p in NEG_PHRASES:
-        if phrase_hit(p, s):
-            neg += 2.5
+def score_normalized(s: str) -> float:
+    """
+    score_segment for text that is already lowercased + normalized
+    (score_text normalizes once; the segments are slices of that string).
+    Two scans per segment: the phrase automaton and the tokenizer.
+    """
+    # 0) Explicit neutral phrases override
+    # 1) Phrase-level signals (one automaton pass for all categories)
+    neutral, pos, neg = phrase_hits(s)
+    if neutral:
+        return 0.0
 
-    toks = tokenize(s)
+    toks = split_tokens(s)
 
     # 2) Token-level with bounded negation + intensifiers
     negation_window = 0  # number of tokens for which negation is active
+    last_intensifier = -3  # index of the most recent intensifier token
 
     for i, t in enumerate(toks):
-        if t in NEGATION_WORDS:
+        c = TOKEN_CLASS.get(t, 0)
+
+        # lookback for intensifiers in previous 1-2 tokens
+        mult = 1.3 if i - last_intensifier <= 2 else 1.0
+        if c & T_INTENSIFIER:
+            last_intensifier = i
+
+        if c & T_NEGATION:
             negation_window = 2
             continue
 
@@ -168,24 +306,18 @@ def score_segment(text: str) -> float:
         if negation_window > 0:
             negation_window -= 1
 
-        # lookback for intensifiers in previous 1-2 tokens
-        prev = toks[max(0, i - 2):i]
-        mult = 1.0
-        if any(x in INTENSIFIERS for x in prev):
-            mult *= 1.3
-
         # Treat ok/okay/fine/fint as neutral tokens
-        if t in {"ok", "okay", "fine", "fint"}:
+        if c & T_NEUTRAL:
             continue
 
-        if t in POS_WORDS:
+        if c & T_POS:
             if negation_pending:
                 neg += 1.0 * mult  # "not good"
             else:
                 pos += 1.0 * mult
             continue
 
-        if t in NEG_WORDS:
+        if c & T_NEG:
             if negation_pending:
                 pos += 0.5 * mult  # "not bad" -> weak positive
             else:
@@ -196,14 +328,22 @@ def score_segment(text: str) -> float:
 
 
 def score_text(text: str) -> int:
-    s = normalize_space(text.lower())
+    # cache key is the normalized text, so case/spacing variants share an entry
+    return score_text_normalized(normalize_space(text.lower()))
 
+
+@lru_cache(maxsize=4096)
+def score_text_normalized(s: str) -> int:
+    """
+    score_text for already normalized text. Pure given the lexicons,
+    so repeated evaluations (batch runs, retries) are a cache hit.
+    """
     # Contrast split: "good but fast" -> often mixed/neutral or second-part-weighted
     split = split_on_contrast(s)
     if split:
         a, b = split
-        sa = score_segment(a)
-        sb = score_segment(b)
+        sa = score_normalized(a)
+        sb = score_normalized(b)
 
         # If opposite signs and both non-trivial -> neutral
         if sa != 0 and sb != 0 and (sa > 0) != (sb > 0):
@@ -212,7 +352,7 @@ def score_text(text: str) -> int:
         # Otherwise: weight the second part a bit more (common in evals)
         raw = 0.8 * sa + 1.2 * sb
     else:
-        raw = score_segment(s)
+        raw = score_normalized(s)
 
     # Wider neutral zone to avoid over-predicting
     if -1.2 < raw < 1.2:
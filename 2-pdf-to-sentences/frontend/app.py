@@ -1,28 +1,64 @@
 from __future__ import annotations
 
+import re
 import time
 from typing import Any, Dict, Optional, Tuple
 
 import httpx, os
 from fastapi import FastAPI, UploadFile, File, Form
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import HTMLResponse, JSONResponse
+from pydantic import BaseModel
 
 
 app = FastAPI(title="DTU PDF Words Demo Frontend", version="1.0.0")
+# sentence lists are plain text: compress anything above ~1 KB
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 DEFAULT_SERVICE_URL = "http://pdf_service:8000"
 REQUEST_TIMEOUT_SECONDS = 10.0
 
+# one pooled client for all uploads: keeps connections to pdf_service alive
+CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    global CLIENT
+    if CLIENT is None:
+        CLIENT = httpx.AsyncClient(
+            timeout=REQUEST_TIMEOUT_SECONDS,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
+    return CLIENT
+
+
+@app.on_event("startup")
+async def on_startup() -> None:
+    get_client()
+
+
+@app.on_event("shutdown")
+async def on_shutdown() -> None:
+    global CLIENT
+    if CLIENT is not None:
+        await CLIENT.aclose()
+        CLIENT = None
+
+
 #call to the pdf_service endpoint
 async def call_external_pdf_words(service_url: str, file: UploadFile) -> Tuple[Optional[Dict[str, Any]], Dict[str, Any]]:
     endpoint = service_url.rstrip("/") + "/v1/extract-sentences"
     t0 = time.perf_counter()
     try:
-        content = await file.read()
-        files = {"pdf_file": (file.filename or "upload.pdf", content, file.content_type or "application/pdf")}
+        # pass the spooled upload file itself: httpx streams it in chunks
+        # instead of us reading the whole PDF into memory first. httpx sizes
+        # the part with fileno(), which rolls a still-in-memory spool over to
+        # a temp file: small uploads pay one disk write, large ones were on
+        # disk already
+        await file.seek(0)
+        files = {"pdf_file": (file.filename or "upload.pdf", file.file, file.content_type or "application/pdf")}
 
-        async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT_SECONDS) as client:
-            r = await client.post(endpoint, files=files)
+        r = await get_client().post(endpoint, files=files)
 
         latency_ms = (time.perf_counter() - t0) * 1000.0
 
@@ -57,6 +93,10 @@ async def call_external_pdf_words(service_url: str, file: UploadFile) -> Tuple[O
             "endpoint": endpoint,
         }
 
+# single .pdf extension, nothing else with a dot (file.pdf.exe, file.v1.pdf)
+PDF_NAME_RE = re.compile(r"[^.]*\.pdf", re.IGNORECASE)
+
+
 def validate_pdf_filename(filename: str) -> bool:
     """
     Accept ONLY filenames ending with a .pdf extension.
@@ -67,23 +107,17 @@ def validate_pdf_filename(filename: str) -> bool:
     """
     if not filename:
         return False
+    return PDF_NAME_RE.fullmatch(os.path.basename(filename)) is not None
 
-    base = os.path.basename(filename)
-    lower = base.lower()
 
-    # Must end with .pdf
-    if not lower.endswith(".pdf"):
-        return False
-
-    # Reject multiple dots like file.pdf.exe or file.v1.pdf.exe
-    name_without_pdf = lower[:-4]  # remove ".pdf"
-    if "." in name_without_pdf:
-        return False
+class PdfWordsResponse(BaseModel):
+    latency_ms: float
+    endpoint: str
+    data: Any  # passed through from the service as-is
 
-    return True
 
-@app.post("/api/pdf-words")
-async def api_pdf_words(service_url: str = Form(...), file: UploadFile = File(...)) -> JSONResponse:
+@app.post("/api/pdf-words", response_model=PdfWordsResponse)
+async def api_pdf_words(service_url: str = Form(...), file: UploadFile = File(...)) -> Any:
     if not service_url.strip():
         return JSONResponse(status_code=400, content={"detail": "Missing service_url."})
     if not validate_pdf_filename(file.filename or ""):
@@ -99,7 +133,8 @@ async def api_pdf_words(service_url: str = Form(...), file: UploadFile = File(..
     if data is None:
         return JSONResponse(status_code=502, content={"detail": info.get("error", "Unknown error.")})
 
-    return JSONResponse(content={"latency_ms": info["latency_ms"], "endpoint": info["endpoint"], "data": data})
+    # error branches above return a JSONResponse as-is; success goes through the model
+    return PdfWordsResponse(latency_ms=info["latency_ms"], endpoint=info["endpoint"], data=data)
 
 
 @app.get("/", response_class=HTMLResponse)
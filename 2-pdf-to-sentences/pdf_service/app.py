@@ -1,13 +1,51 @@
 from fastapi import FastAPI, UploadFile, File, HTTPException
+from fastapi.middleware.gzip import GZipMiddleware
+from pydantic import BaseModel
 import fitz
-import re
+from typing import Iterable, Iterator, List
 
 app = FastAPI()
+# sentence lists are plain text: compress anything above ~1 KB
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
-SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
 
-@app.post("/v1/extract-sentences")
-async def extract_sentences(pdf_file: UploadFile = File(...)):
+class SentencesResponse(BaseModel):
+    # typed List[str]: pydantic-core writes it out without a jsonable_encoder pass
+    sentences: List[str]
+
+
+SENTENCE_END = (".", "!", "?")
+
+
+def iter_sentences(words: Iterable[str]) -> Iterator[str]:
+    """
+    Single pass over whitespace-free words: a sentence ends at a word
+    ending with . ! or ?  (same result as splitting the space-joined
+    text on whitespace after [.!?], without building that text).
+    """
+    cur: List[str] = []
+    for w in words:
+        cur.append(w)
+        if w.endswith(SENTENCE_END):
+            yield " ".join(cur)
+            cur = []
+    if cur:
+        yield " ".join(cur)
+
+
+def iter_page_words(doc: fitz.Document) -> Iterator[str]:
+    """
+    Cleaned words, page by page. MuPDF already splits the page into words
+    (in C); we drop soft hyphens and re-split, since MuPDF keeps some
+    unicode spaces (e.g. U+2002) inside its words.
+    """
+    for page in doc:
+        t = " ".join(w[4] for w in page.get_text("words"))
+        yield from t.replace("\u00ad", "").split()
+
+
+@app.post("/v1/extract-sentences", response_model=SentencesResponse)
+async def extract_sentences(pdf_file: UploadFile = File(...)) -> SentencesResponse:
     data = await pdf_file.read()
     if not data:
         raise HTTPException(status_code=400, detail="Empty upload.")
@@ -17,18 +55,10 @@ async def extract_sentences(pdf_file: UploadFile = File(...)):
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Could not open PDF: {e}")
 
-    parts = []
-    for page in doc:
-        parts.append(page.get_text("text"))
+    # page-local: words are produced one page at a time and consumed by
+    # iter_sentences right away; a sentence running over a page break is
+    # simply still pending in iter_sentences when the next page starts
+    sentences = list(iter_sentences(iter_page_words(doc)))
     doc.close()
 
-    text = "\n".join(parts)
-
-    # basic cleanup
-    text = text.replace("\u00ad", "")
-    text = re.sub(r"\s+", " ", text)
-
-    sentences = SENTENCE_RE.split(text)
-    sentences = [s.strip() for s in sentences if s.strip()]
-
-    return {"sentences": sentences}
\ No newline at end of file
+    return SentencesResponse(sentences=sentences)
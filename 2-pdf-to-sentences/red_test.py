@@ -10,27 +10,38 @@ python test.py --target frontend --base-url http://localhost:8001 --service-url
 # 2) Test the PDF SERVICE directly
 python test.py --target service --base-url http://localhost:8000
 
+# 3) Bigger concurrency burst with the aiohttp client (pip install aiohttp)
+python test.py --target frontend --base-url http://localhost:8001 --concurrency 200 --http-backend aiohttp
+
 """
 
 from __future__ import annotations
 
 import argparse
 import asyncio
+import io
 import os
 import random
 import string
+import sys
 import time
+from contextlib import AsyncExitStack
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import httpx
 
+try:
+    import uvloop
+except ImportError:  # optional: pip install uvloop for a faster event loop
+    uvloop = None
+
 
 # ----------------------------
 # Helpers
 # ----------------------------
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     name: str
     ok: bool
@@ -44,57 +55,200 @@ def now_ms() -> float:
 def rand_bytes(n: int) -> bytes:
     return os.urandom(n)
 
+# A file that *pretends* to be PDF-like but is not a valid PDF.
+# Some servers check for %PDF header; this starts with that but is still invalid.
+_FAKE_PDF_BYTES = b"%PDF-1.4\n%Fake\n1 0 obj\n<<>>\nendobj\ntrailer\n<<>>\n%%EOF\nNOT_A_REAL_PDF"
+
+# This is a very small PDF with one empty page (common minimal sample).
+_TINY_PDF = (
+    b"%PDF-1.4\n"
+    b"1 0 obj<< /Type /Catalog /Pages 2 0 R >>endobj\n"
+    b"2 0 obj<< /Type /Pages /Kids [3 0 R] /Count 1 >>endobj\n"
+    b"3 0 obj<< /Type /Page /Parent 2 0 R /MediaBox [0 0 300 300] "
+    b"/Contents 4 0 R /Resources <<>> >>endobj\n"
+    b"4 0 obj<< /Length 0 >>stream\nendstream\nendobj\n"
+    b"xref\n0 5\n0000000000 65535 f \n"
+    b"0000000010 00000 n \n"
+    b"0000000062 00000 n \n"
+    b"0000000117 00000 n \n"
+    b"0000000246 00000 n \n"
+    b"trailer<< /Size 5 /Root 1 0 R >>\nstartxref\n320\n%%EOF\n"
+)
+
 def fake_pdf_bytes() -> bytes:
+    return _FAKE_PDF_BYTES
+
+def tiny_valid_pdf_bytes_minimal() -> bytes:
+    return _TINY_PDF
+
+class RandomPdfUpload(io.RawIOBase):
     """
-    A file that *pretends* to be PDF-like but is not a valid PDF.
-    Some servers check for %PDF header; this starts with that but is still invalid.
+    File-like large upload: the fake PDF header followed by `extra` random
+    bytes, generated chunk by chunk as the client reads it, so the payload
+    is never held in memory. seek/tell work (random bytes are position-free),
+    which lets httpx size the part and send a Content-Length.
     """
-    return b"%PDF-1.4\n%Fake\n1 0 obj\n<<>>\nendobj\ntrailer\n<<>>\n%%EOF\nNOT_A_REAL_PDF"
 
-def tiny_valid_pdf_bytes_minimal() -> bytes:
-    # This is a very small PDF with one empty page (common minimal sample).
-    return (
-        b"%PDF-1.4\n"
-        b"1 0 obj<< /Type /Catalog /Pages 2 0 R >>endobj\n"
-        b"2 0 obj<< /Type /Pages /Kids [3 0 R] /Count 1 >>endobj\n"
-        b"3 0 obj<< /Type /Page /Parent 2 0 R /MediaBox [0 0 300 300] "
-        b"/Contents 4 0 R /Resources <<>> >>endobj\n"
-        b"4 0 obj<< /Length 0 >>stream\nendstream\nendobj\n"
-        b"xref\n0 5\n0000000000 65535 f \n"
-        b"0000000010 00000 n \n"
-        b"0000000062 00000 n \n"
-        b"0000000117 00000 n \n"
-        b"0000000246 00000 n \n"
-        b"trailer<< /Size 5 /Root 1 0 R >>\nstartxref\n320\n%%EOF\n"
-    )
+    def __init__(self, extra: int):
+        self._size = len(_FAKE_PDF_BYTES) + extra
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._pos, io.SEEK_END: self._size}[whence]
+        self._pos = max(0, base + offset)
+        return self._pos
+
+    def read(self, n: int = -1) -> bytes:
+        if self._pos >= self._size:  # at or seeked past EOF
+            return b""
+        end = self._size if n is None or n < 0 else min(self._size, self._pos + n)
+        head_end = min(end, len(_FAKE_PDF_BYTES))
+        chunk = _FAKE_PDF_BYTES[self._pos:head_end] if self._pos < head_end else b""
+        chunk += rand_bytes(end - max(self._pos, head_end))
+        self._pos = max(self._pos, end)
+        return chunk
 
 def random_filename(ext: str = ".pdf") -> str:
-    s = "".join(random.choice(string.ascii_lowercase) for _ in range(8))
+    s = "".join(random.choices(string.ascii_lowercase, k=8))
     return f"{s}{ext}"
 
 def snippet(text: str, n: int = 200) -> str:
     t = text.replace("\n", "\\n")
     return t[:n] + ("…" if len(t) > n else "")
 
+def make_client(timeout_s: float, concurrency: int, backend: str = "httpx") -> Any:
+    """
+    Client sized for the T8 burst: every concurrent upload gets a pooled
+    connection, and idle connections survive the gaps between tests
+    (httpx default keep-alive is 5 s).
+    """
+    pool = max(100, concurrency * 2)
+    if backend == "aiohttp":
+        return AiohttpClient(timeout_s, pool)
+    limits = httpx.Limits(max_connections=pool, max_keepalive_connections=pool, keepalive_expiry=15.0)
+    return httpx.AsyncClient(timeout=timeout_s, limits=limits)
+
+
+@dataclass
+class SimpleResponse:
+    status_code: int
+    content: bytes
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", "replace")
+
+
+# what the post helpers return: a full httpx response, or a SimpleResponse
+# (aiohttp backend, or a status-only request that read just the head)
+PostResponse = Union[httpx.Response, SimpleResponse]
+
+
+class AiohttpClient:
+    """
+    Minimal httpx.AsyncClient look-alike on top of aiohttp, for the
+    --http-backend aiohttp option: only post(url, data=, files=, json=)
+    (plus head_bytes= for post_request(need_body=False)),
+    which is all the tests use. aiohttp is imported lazily so the default
+    httpx backend does not need it installed.
+    """
+
+    def __init__(self, timeout_s: float, pool: int) -> None:
+        import aiohttp
+
+        self._aiohttp = aiohttp
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=0, limit_per_host=pool, keepalive_timeout=15),
+            timeout=aiohttp.ClientTimeout(total=timeout_s),
+        )
+
+    async def post(
+        self,
+        url: str,
+        data: Optional[Dict[str, str]] = None,
+        files: Optional[Dict[str, Tuple[str, bytes, str]]] = None,
+        json: Any = None,
+        head_bytes: Optional[int] = None,
+    ) -> SimpleResponse:
+        body: Any = data
+        if files:
+            form = self._aiohttp.FormData()
+            for key, value in (data or {}).items():
+                form.add_field(key, value)
+            for key, (filename, content, content_type) in files.items():
+                form.add_field(key, content, filename=filename, content_type=content_type)
+            body = form
+        async with self._session.post(url, data=body, json=json) as r:
+            if head_bytes is None:
+                return SimpleResponse(status_code=r.status, content=await r.read())
+            content = b""
+            while len(content) < head_bytes:
+                chunk = await r.content.read(head_bytes - len(content))
+                if not chunk:
+                    break
+                content += chunk
+            return SimpleResponse(status_code=r.status, content=content)
+
+    async def __aenter__(self) -> "AiohttpClient":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self._session.close()
+
 
 # ----------------------------
 # HTTP calls
 # ----------------------------
 
+# how much of the body a status-only check reads; it only ever ends up in a
+# truncated snippet of the report
+DETAIL_BYTES = 1024
+
+async def post_request(client: Any, url: str, need_body: bool = True, **kwargs: Any) -> PostResponse:
+    """
+    client.post(url, **kwargs). With need_body=True the full response is
+    returned and its whole body ends up in TestResult.detail for the body
+    checks. With need_body=False only the status and the first DETAIL_BYTES
+    of the body are read: the rest is never downloaded or
+    decoded (the connection is closed instead of drained, so only responses
+    longer than that lose their keep-alive).
+    """
+    if need_body:
+        return await client.post(url, **kwargs)
+    if isinstance(client, AiohttpClient):
+        return await client.post(url, head_bytes=DETAIL_BYTES, **kwargs)
+    async with client.stream("POST", url, **kwargs) as r:
+        head = b""
+        async for chunk in r.aiter_bytes():
+            head += chunk
+            if len(head) >= DETAIL_BYTES:
+                break
+        return SimpleResponse(status_code=r.status_code, content=head[:DETAIL_BYTES])
+
 async def post_to_service(
     client: httpx.AsyncClient,
     base_url: str,
     pdf_bytes: bytes,
     filename: str = "upload.pdf",
     content_type: str = "application/pdf",
-) -> httpx.Response:
+    need_body: bool = True,
+) -> PostResponse:
     """
     Direct call to PDF service:
       POST {base_url}/v1/pdf-to-words  (multipart field "file")
     """
     url = base_url.rstrip("/") + "/v1/pdf-to-words"
     files = {"file": (filename, pdf_bytes, content_type)}
-    return await client.post(url, files=files)
+    return await post_request(client, url, need_body, files=files)
 
 async def post_to_frontend(
     client: httpx.AsyncClient,
@@ -103,7 +257,8 @@ async def post_to_frontend(
     pdf_bytes: bytes,
     filename: str = "upload.pdf",
     content_type: str = "application/pdf",
-) -> httpx.Response:
+    need_body: bool = True,
+) -> PostResponse:
     """
     Call frontend:
       POST {base_url}/api/pdf-words  (multipart fields "service_url" + "file")
@@ -111,28 +266,30 @@ async def post_to_frontend(
     url = base_url.rstrip("/") + "/api/pdf-words"
     files = {"file": (filename, pdf_bytes, content_type)}
     data = {"service_url": service_url}
-    return await client.post(url, data=data, files=files)
+    return await post_request(client, url, need_body, data=data, files=files)
 
 async def post_wrong_content_type_json(
     client: httpx.AsyncClient,
     url: str,
-) -> httpx.Response:
+) -> PostResponse:
     """
     Send JSON instead of multipart to test wrong content type handling.
     """
-    return await client.post(url, json={"hello": "world"})
+    return await post_request(client, url, need_body=False, json={"hello": "world"})
 
 
 # ----------------------------
 # Tests
 # ----------------------------
 
+T8_MAX_IN_FLIGHT = 200
+
 async def run_one_test(name: str, coro) -> TestResult:
     t0 = now_ms()
     try:
-        r: httpx.Response = await coro
+        r: PostResponse = await coro
         elapsed = now_ms() - t0
-        return TestResult(name=name, ok=True, status_code=r.status_code, elapsed_ms=elapsed, detail=r.text)
+        return TestResult(name=name, ok=True, status_code=r.status_code, elapsed_ms=elapsed, detail=r.content.decode("utf-8", "replace"))
     except Exception as e:
         elapsed = now_ms() - t0
         return TestResult(name=name, ok=False, status_code=None, elapsed_ms=elapsed, detail=f"{type(e).__name__}: {e}")
@@ -154,35 +311,47 @@ async def red_team_suite(
     timeout_s: float,
     pdf_paths: List[str],
     concurrency: int,
+    client: Optional[httpx.AsyncClient] = None,
+    http_backend: str = "httpx",
 ) -> List[TestResult]:
+    """
+    Run all tests against one target. Pass `client` to reuse a long-lived
+    client (and its warm connections) across suites, e.g. when this file
+    is imported as a library; otherwise a tuned one is created and closed here.
+    """
     results: List[TestResult] = []
 
-    async with httpx.AsyncClient(timeout=timeout_s) as client:
+    async with AsyncExitStack() as stack:
+        if client is None:
+            client = await stack.enter_async_context(make_client(timeout_s, concurrency, http_backend))
+
         # Decide which caller to use
-        async def send(pdf_bytes: bytes, filename="upload.pdf", ctype="application/pdf"):
+        # status-only checks (T1-T8) pass need_body=False; T9 keeps the whole
+        # body (need_body=True) for its "words" check
+        async def send(pdf_bytes: bytes, filename="upload.pdf", ctype="application/pdf", need_body=True):
             if target == "service":
-                return await post_to_service(client, base_url, pdf_bytes, filename=filename, content_type=ctype)
-            return await post_to_frontend(client, base_url, service_url, pdf_bytes, filename=filename, content_type=ctype)
+                return await post_to_service(client, base_url, pdf_bytes, filename=filename, content_type=ctype, need_body=need_body)
+            return await post_to_frontend(client, base_url, service_url, pdf_bytes, filename=filename, content_type=ctype, need_body=need_body)
 
         # --- 1) Validation ---
-        r = await run_one_test("T1 fake pdf renamed txt", send(b"hello i am not a pdf", filename="note.pdf"))
+        r = await run_one_test("T1 fake pdf renamed txt", send(b"hello i am not a pdf", filename="note.pdf", need_body=False))
         # acceptable: 400-ish (service) OR 502 (frontend proxy) depending on architecture
         results.append(expect_status_in(r, (400, 415, 422, 500, 502), "Should reject non-PDF / fail gracefully"))
 
-        r = await run_one_test("T2 double extension file.pdf.exe", send(fake_pdf_bytes(), filename="file.pdf.exe"))
+        r = await run_one_test("T2 double extension file.pdf.exe", send(fake_pdf_bytes(), filename="file.pdf.exe", need_body=False))
         results.append(expect_status_in(r, (400, 415, 422, 500, 502), "Should reject suspicious / invalid file"))
 
-        r = await run_one_test("T3 corrupted random bytes", send(rand_bytes(4096), filename="corrupt.pdf"))
+        r = await run_one_test("T3 corrupted random bytes", send(rand_bytes(4096), filename="corrupt.pdf", need_body=False))
         results.append(expect_status_in(r, (400, 415, 422, 500, 502), "Should reject corrupted PDF gracefully"))
 
         # Wrong content-type (octet-stream) but pdf-ish bytes
-        r = await run_one_test("T4 octet-stream content-type", send(fake_pdf_bytes(), filename="upload.pdf", ctype="application/octet-stream"))
+        r = await run_one_test("T4 octet-stream content-type", send(fake_pdf_bytes(), filename="upload.pdf", ctype="application/octet-stream", need_body=False))
         results.append(expect_status_in(r, (200, 400, 500, 502), "Should handle octet-stream (browser often uses it)"))
 
         # Missing service_url only applies to frontend
         if target == "frontend":
             url = base_url.rstrip("/") + "/api/pdf-words"
-            r0 = await run_one_test("T5 missing service_url field", client.post(url, files={"file": ("x.pdf", fake_pdf_bytes(), "application/pdf")}))
+            r0 = await run_one_test("T5 missing service_url field", post_request(client, url, need_body=False, files={"file": ("x.pdf", fake_pdf_bytes(), "application/pdf")}))
             results.append(expect_status_in(r0, (400, 422), "Frontend should reject missing service_url"))
 
             r1 = await run_one_test("T6 wrong content-type (json instead of multipart)", post_wrong_content_type_json(client, url))
@@ -190,16 +359,32 @@ async def red_team_suite(
 
         # Resource / DoS-ish (lightweight)
         # Large payload (tune size as needed). Keep modest to avoid killing your own machine.
-        big = fake_pdf_bytes() + rand_bytes(2_000_000)  # ~2MB extra
-        r = await run_one_test("T7 large upload (~2MB extra)", send(big, filename="big.pdf"))
+        big = RandomPdfUpload(2_000_000)  # ~2MB extra, streamed
+        r = await run_one_test("T7 large upload (~2MB extra)", send(big, filename="big.pdf", need_body=False))
         results.append(expect_status_in(r, (200, 400, 413, 500, 502), "Should handle or reject large upload gracefully"))
 
-        # Concurrency test
+        # Concurrency test: every request uploads the same bytes, so build them once
+        small = fake_pdf_bytes()
+
         async def one_small(i: int):
-            return await send(fake_pdf_bytes(), filename=f"c{i}.pdf")
+            return await send(small, filename=f"c{i}.pdf", need_body=False)
+
+        # at most T8_MAX_IN_FLIGHT uploads are open at once; results are
+        # consumed as they land so the first/last response times are visible
+        sem = asyncio.Semaphore(max(1, min(concurrency, T8_MAX_IN_FLIGHT)))
+
+        async def guarded(i: int) -> TestResult:
+            async with sem:
+                return await run_one_test(f"T8 concurrency upload #{i+1}", one_small(i))
 
         t0 = now_ms()
-        rs = await asyncio.gather(*[run_one_test(f"T8 concurrency upload #{i+1}", one_small(i)) for i in range(concurrency)])
+        tasks = [asyncio.create_task(guarded(i)) for i in range(concurrency)]
+        rs: List[TestResult] = []
+        first_ms = 0.0
+        for fut in asyncio.as_completed(tasks):
+            rs.append(await fut)
+            if len(rs) == 1:
+                first_ms = now_ms() - t0
         elapsed = now_ms() - t0
 
         # here accept mixed outcomes; key is "no crashes/hangs". Mark PASS if most returned a response.
@@ -210,7 +395,7 @@ async def red_team_suite(
             ok=ok,
             status_code=None,
             elapsed_ms=elapsed,
-            detail=f"Responses received: {responded}/{concurrency}",
+            detail=f"Responses received: {responded}/{concurrency} (first after {first_ms:.1f} ms, last after {elapsed:.1f} ms)",
         ))
 
         # --- 4) Optional: real PDFs provided (quality tests) ---
@@ -239,19 +424,21 @@ async def red_team_suite(
 # ----------------------------
 
 def print_report(results: List[TestResult]) -> None:
-    print("\n=== RED TEAM TEST REPORT ===\n")
+    # built in full, then written once (one stdout lock/flush, not 4 per result)
+    lines = ["\n=== RED TEAM TEST REPORT ===\n"]
     passed = 0
     for r in results:
         status = "PASS" if r.ok else "FAIL"
         code = "-" if r.status_code is None else str(r.status_code)
-        print(f"[{status}] {r.name} | HTTP={code} | {r.elapsed_ms:.1f} ms")
+        lines.append(f"[{status}] {r.name} | HTTP={code} | {r.elapsed_ms:.1f} ms")
         if not r.ok:
-            print(f"       {snippet(r.detail, 300)}")
+            lines.append(f"       {snippet(r.detail, 300)}")
         else:
-            print(f"       {r.detail}")
-        print()
+            lines.append(f"       {r.detail}")
+        lines.append("")
         passed += int(r.ok)
-    print(f"Summary: {passed}/{len(results)} passed\n")
+    lines.append(f"Summary: {passed}/{len(results)} passed\n\n")
+    sys.stdout.write("\n".join(lines))
 
 def parse_args() -> argparse.Namespace:
     ap = argparse.ArgumentParser()
@@ -264,17 +451,21 @@ def parse_args() -> argparse.Namespace:
     ap.add_argument("--timeout", type=float, default=10.0, help="HTTP timeout seconds.")
     ap.add_argument("--pdf", action="append", default=[], help="Optional path to a real PDF to include in tests (repeatable).")
     ap.add_argument("--concurrency", type=int, default=10, help="Number of concurrent upload requests for the stress test.")
+    ap.add_argument("--http-backend", choices=["httpx", "aiohttp"], default="httpx",
+                    help="HTTP client library. aiohttp (pip install aiohttp) holds up better at high --concurrency.")
     return ap.parse_args()
 
 def main() -> None:
     args = parse_args()
-    results = asyncio.run(red_team_suite(
+    run = uvloop.run if uvloop is not None else asyncio.run
+    results = run(red_team_suite(
         target=args.target,
         base_url=args.base_url,
         service_url=args.service_url,
         timeout_s=args.timeout,
         pdf_paths=args.pdf,
         concurrency=args.concurrency,
+        http_backend=args.http_backend,
     ))
     print_report(results)
 
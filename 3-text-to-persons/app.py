@@ -1,10 +1,24 @@
+import hashlib
 import json
-import re
+import os
+from collections import OrderedDict
 
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 
-from campus_ai_api import send_message
+import campus_ai_api
+from campus_ai_api import send_message, send_message_async
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # optional: without it only the in-process cache is used
+    aioredis = None
+
+try:
+    import orjson
+    _json_loads, _json_dumps = orjson.loads, orjson.dumps
+except ImportError:  # optional: falls back to the (slower) stdlib parser
+    _json_loads, _json_dumps = json.loads, json.dumps
 
 
 app = FastAPI()
@@ -29,21 +43,36 @@ PROMPT_TEMPLATE = (
 )
 
 
+# bounds the work spent on a runaway model reply
+MAX_ENTITIES_PER_CATEGORY = 10000
+
+# raw_decode parses the first complete JSON value in C (string-aware, no regex)
+_JSON_DECODER = json.JSONDecoder()
+
+
 def _parse_entities(content: str) -> dict[str, list[str]]:
+    text = content.strip()
+    if text.startswith("```"):
+        # ```json\n{...}\n``` despite the prompt: drop the fence, keep the fast parse
+        text = text.strip("`").split("\n", 1)[-1]
     try:
-        data = json.loads(content)
-    except json.JSONDecodeError:
-        match = re.search(r"\{.*}", content, re.S)
-        if not match:
+        data = _json_loads(text)
+    except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses it
+        # extra text around the object: parse from the first "{"
+        start = content.find("{")
+        if start == -1:
             raise ValueError("No JSON object found in response")
-        data = json.loads(match.group(0))
+        data, _ = _JSON_DECODER.raw_decode(content, start)
 
     if not isinstance(data, dict):
         raise ValueError("Invalid entities field in response")
     cleaned = {}
     for key, value in data.items():
         if isinstance(key, str) and isinstance(value, list):
-            cleaned[key] = [str(v) for v in value]
+            if len(value) > MAX_ENTITIES_PER_CATEGORY:
+                raise ValueError(f"Too many entities in category {key!r}")
+            # model output is almost always strings already: skip the str() call
+            cleaned[key] = [v if type(v) is str else str(v) for v in value]
     return cleaned
 
 #parses the campusai json response, which is OpanAi compatible
@@ -58,11 +87,7 @@ def _extract_content(response: dict) -> str:
     raise ValueError(f"Unexpected CampusAI response structure: {response}")
 
 
-def extract_entities(text: str) -> dict[str, list[str]]:
-    prompt = PROMPT_TEMPLATE.format(text=text)
-    #api call
-    response = send_message(prompt)
-
+def _entities_from_response(response: dict) -> dict[str, list[str]]:
     content = _extract_content(response)
     try:
         parsed = _parse_entities(content)
@@ -73,10 +98,114 @@ def extract_entities(text: str) -> dict[str, list[str]]:
     return parsed
 
 
+def extract_entities(text: str) -> dict[str, list[str]]:
+    prompt = PROMPT_TEMPLATE.format(text=text)
+    #api call
+    response = send_message(prompt)
+    return _entities_from_response(response)
+
+
+# --- Result cache --------------------------------------------------------------
+# Repeated texts (tests, red-team runs) skip the LLM round-trip: first an
+# in-process LRU, then Redis if REDIS_URL is set and the redis package is
+# installed (shared across workers/containers). Both are best effort.
+
+CACHE_TTL_SECONDS = 3600
+LOCAL_CACHE_SIZE = 1024
+# Answers depend on the model, the temperature and the prompt: the namespace
+# hashes all three, so changing any of them never reuses old answers
+CACHE_NAMESPACE = hashlib.blake2b(
+    f"{campus_ai_api.DEFAULT_MODEL}|{campus_ai_api.DEFAULT_TEMPERATURE}|{PROMPT_TEMPLATE}".encode(),
+    digest_size=32,
+).digest()
+
+_LOCAL_CACHE: "OrderedDict[str, dict[str, list[str]]]" = OrderedDict()
+_REDIS = None
+
+
+def _cache_key(text: str) -> str:
+    return hashlib.blake2b(text.encode(), digest_size=16, key=CACHE_NAMESPACE).hexdigest()
+
+
+def _copy_entities(entities: dict[str, list[str]]) -> dict[str, list[str]]:
+    # cached values are never handed out directly, callers may mutate them
+    return {key: list(value) for key, value in entities.items()}
+
+
+def _local_get(key: str) -> dict[str, list[str]] | None:
+    entities = _LOCAL_CACHE.get(key)
+    if entities is not None:
+        _LOCAL_CACHE.move_to_end(key)
+    return entities
+
+
+def _local_put(key: str, entities: dict[str, list[str]]) -> None:
+    _LOCAL_CACHE[key] = entities
+    _LOCAL_CACHE.move_to_end(key)
+    if len(_LOCAL_CACHE) > LOCAL_CACHE_SIZE:
+        _LOCAL_CACHE.popitem(last=False)
+
+
+async def _redis_get(key: str) -> dict[str, list[str]] | None:
+    if _REDIS is None:
+        return None
+    try:
+        raw = await _REDIS.get("ee:" + key)
+    except Exception:
+        return None
+    return _json_loads(raw) if raw else None
+
+
+async def _redis_put(key: str, entities: dict[str, list[str]]) -> None:
+    if _REDIS is None:
+        return
+    try:
+        await _REDIS.setex("ee:" + key, CACHE_TTL_SECONDS, _json_dumps(entities))
+    except Exception:
+        pass
+
+
+async def extract_entities_async(text: str) -> dict[str, list[str]]:
+    # same as extract_entities, but waits on CampusAI without holding a threadpool thread
+    key = _cache_key(text)
+    cached = _local_get(key)
+    if cached is None:
+        cached = await _redis_get(key)
+        if cached is not None:
+            _local_put(key, cached)
+    if cached is not None:
+        return _copy_entities(cached)
+
+    prompt = PROMPT_TEMPLATE.format(text=text)
+    response = await send_message_async(prompt)
+    parsed = _entities_from_response(response)
+
+    _local_put(key, _copy_entities(parsed))
+    await _redis_put(key, parsed)
+    return parsed
+
+
+@app.on_event("startup")
+async def on_startup() -> None:
+    global _REDIS
+    url = os.getenv("REDIS_URL")
+    if url and aioredis is not None:
+        _REDIS = aioredis.Redis.from_url(url)
+
+
+@app.on_event("shutdown")
+async def on_shutdown() -> None:
+    global _REDIS
+    await campus_ai_api.aclose()
+    if _REDIS is not None:
+        await _REDIS.aclose()
+        _REDIS = None
+
+
 @app.post("/v1/extract-persons", response_model=ResponseModel)
-def extract_persons_endpoint(req: ExtractRequest):
+async def extract_persons_endpoint(req: ExtractRequest):
     try:
-        entities = extract_entities(req.text)
+        entities = await extract_entities_async(req.text)
     except Exception as exc:
         raise HTTPException(status_code=502, detail=str(exc)) from exc
     return entities
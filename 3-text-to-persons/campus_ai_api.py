@@ -1,35 +1,112 @@
+import json
 import os
+
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # optional: falls back to the (slower) stdlib parser
+    _json_loads = json.loads
 
 
 API_URL = "https://chat.campusai.compute.dtu.dk/api/chat/completions"
+# defaults of send_message/send_message_async
+DEFAULT_MODEL = "Gemma3"
+DEFAULT_TEMPERATURE = 0.0
 
+# One pooled session per process: keeps the TLS connection to CampusAI alive
+# between calls instead of a new handshake per request. Retries cover only
+# what tells us the completion never ran: failed connects and 429/503
+# (POST included for those). 502/504 and read timeouts are not retried,
+# since the upstream may already have run the completion; the last response
+# is still returned as-is.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=2,
+        read=0,
+        backoff_factor=0.2,
+        status_forcelist=(429, 503),
+        allowed_methods=frozenset({"POST"}),
+        raise_on_status=False,
+    ),
+))
 
-def send_message(prompt, model="Gemma3", temperature=0.0, timeout=30):
-    api_key = os.getenv("CAMPUS_AI_API_KEY") or os.getenv("CAMPUSAI_API_KEY")
-    if not api_key:
-        raise RuntimeError("Missing CAMPUS_AI_API_KEY (or CAMPUSAI_API_KEY) in environment")
 
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-    }
+# Async twin of _SESSION for the async FastAPI endpoint (created lazily, inside
+# the running event loop; close it with aclose() on shutdown).
+_ACLIENT = None
+
+
+def _get_async_client():
+    global _ACLIENT
+    if _ACLIENT is None:
+        limits = httpx.Limits(max_connections=64, max_keepalive_connections=64, keepalive_expiry=15.0)
+        _ACLIENT = httpx.AsyncClient(
+            timeout=30,
+            follow_redirects=True,
+            transport=httpx.AsyncHTTPTransport(retries=2, limits=limits),
+        )
+    return _ACLIENT
+
+
+async def aclose():
+    global _ACLIENT
+    if _ACLIENT is not None:
+        await _ACLIENT.aclose()
+        _ACLIENT = None
+
+
+# Read once at import (like 6-retrieval-augmented generation/app_campusai.py):
+# the headers are shared by every request, only the prompt varies.
+CAMPUSAI_API_KEY = os.getenv("CAMPUS_AI_API_KEY") or os.getenv("CAMPUSAI_API_KEY")
+_HEADERS = {
+    "Authorization": f"Bearer {CAMPUSAI_API_KEY}",
+    "Content-Type": "application/json",
+} if CAMPUSAI_API_KEY else None
+_PAYLOAD_BASE = {"stream": False}
+
+
+def _build_request(prompt, model, temperature):
+    if _HEADERS is None:
+        raise RuntimeError("Missing CAMPUS_AI_API_KEY (or CAMPUSAI_API_KEY) in environment")
 
     payload = {
+        **_PAYLOAD_BASE,
         "model": model,
         "messages": [
             {"role": "user", "content": prompt},
         ],
         "temperature": temperature,
-        "stream": False,
     }
+    return _HEADERS, payload
+
 
-    response = requests.post(API_URL, json=payload, headers=headers, timeout=timeout)
+def _handle_response(response, ok):
     try:
-        data = response.json()
+        # parse the raw bytes directly, no intermediate str decode
+        data = _json_loads(response.content)
     except ValueError:
         data = {"_raw": response.text, "_status": response.status_code}
 
-    if not response.ok:
+    if not ok:
         raise RuntimeError(f"CampusAI error {response.status_code}: {data}")
     return data
+
+
+def send_message(prompt, model=DEFAULT_MODEL, temperature=DEFAULT_TEMPERATURE, timeout=30):
+    headers, payload = _build_request(prompt, model, temperature)
+    response = _SESSION.post(API_URL, json=payload, headers=headers, timeout=timeout)
+    return _handle_response(response, response.ok)
+
+
+async def send_message_async(prompt, model=DEFAULT_MODEL, temperature=DEFAULT_TEMPERATURE, timeout=30):
+    headers, payload = _build_request(prompt, model, temperature)
+    response = await _get_async_client().post(API_URL, json=payload, headers=headers, timeout=timeout)
+    return _handle_response(response, not response.is_error)
@@ -16,4 +16,35 @@ def test_examples_from_prompt(monkeypatch):
     monkeypatch.setattr(app, "send_message", fake_send_message)
 
     result = app.extract_entities("Ms Mette Frederiksen is in New York today.")
-    assert result == {"persons": ["Mette Frederiksen"]}
\ No newline at end of file
+    assert result == {"persons": ["Mette Frederiksen"]}
+
+def test_extract_persons_endpoint(monkeypatch):
+    from fastapi.testclient import TestClient
+
+    async def fake_send_message_async(prompt):
+        return {"choices": [{"message": {"content": json.dumps({"persons": ["Niels Bohr"]})}}]}
+
+    monkeypatch.setattr(app, "send_message_async", fake_send_message_async)
+
+    response = TestClient(app.app).post("/v1/extract-persons", json={"text": "Niels Bohr taught in Copenhagen."})
+    assert response.status_code == 200
+    assert response.json() == {"persons": ["Niels Bohr"]}
+
+
+def test_repeated_text_is_cached(monkeypatch):
+    import asyncio
+
+    calls = []
+
+    async def fake_send_message_async(prompt):
+        calls.append(prompt)
+        return {"choices": [{"message": {"content": json.dumps({"persons": ["Tycho Brahe"]})}}]}
+
+    monkeypatch.setattr(app, "send_message_async", fake_send_message_async)
+
+    text = "Tycho Brahe observed the sky from Hven."
+    first = asyncio.run(app.extract_entities_async(text))
+    first["persons"].append("mutated")
+    second = asyncio.run(app.extract_entities_async(text))
+    assert second == {"persons": ["Tycho Brahe"]}
+    assert len(calls) == 1
@@ -70,16 +70,30 @@ include in the generated Web app.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import os
 import time
+from collections import Counter, OrderedDict, deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 import httpx
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, Response
 from pydantic import BaseModel, Field
 
+try:
+    import orjson
+    json_loads, json_dumps = orjson.loads, orjson.dumps
+except ImportError:  # optional: the standard library parser works too, just slower
+    json_loads = json.loads
+
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
 
 # ----------------------------
 # Configuration
@@ -88,6 +102,22 @@ from pydantic import BaseModel, Field
 SERVICE_BASE_URL = os.environ.get("PERSON_SERVICE_URL", "http://localhost:8000").rstrip("/")
 SERVICE_ENDPOINT = os.environ.get("PERSON_SERVICE_ENDPOINT", "/v1/extract-persons")
 SERVICE_TIMEOUT_SECONDS = float(os.environ.get("PERSON_SERVICE_TIMEOUT_SECONDS", "10.0"))
+SERVICE_URL = f"{SERVICE_BASE_URL}{SERVICE_ENDPOINT}"
+# How many test examples /api/run-tests sends to the service at the same time
+# (at least 1: a zero-slot semaphore would leave every call waiting forever)
+TEST_CONCURRENCY = max(1, int(os.environ.get("PERSON_SERVICE_TEST_CONCURRENCY", "16")))
+# Opt-in HTTP/2 (needs: pip install "httpx[http2]"). Only helps when the service
+# is reached over https through a server that speaks HTTP/2; uvicorn itself
+# only speaks HTTP/1.1, so the default stays off.
+SERVICE_HTTP2 = os.environ.get("PERSON_SERVICE_HTTP2", "0") == "1"
+# Largest number of texts accepted by /api/extract-persons-batch in one request
+BATCH_MAX_TEXTS = 100
+# Remember successful answers per text (set to 0 while developing the service,
+# so every click really calls it again)
+CACHE_ENABLED = os.environ.get("PERSON_SERVICE_CACHE", "1") != "0"
+CACHE_SIZE = 4096
+# Number of recent requests the average latency is computed over
+LATENCY_WINDOW = 1024
 
 
 # ----------------------------
@@ -271,12 +301,21 @@ class Metrics:
     -----
     This is intentionally simple and process-local (no database).
     If you run multiple worker processes, each process will have its own metrics.
+    The average latency covers the last ``LATENCY_WINDOW`` requests, so memory
+    stays constant however long the app runs.
+
+    No lock is needed: every endpoint is ``async def`` and runs on the one
+    event-loop thread, and ``record`` never awaits, so an update cannot be
+    interleaved with another one. Keep it that way (no ``await`` inside
+    ``record``, no calls from sync endpoints running in the threadpool).
     """
     total_requests: int = 0
     success_requests: int = 0
     failed_requests: int = 0
+    cache_hits: int = 0
     last_latency_ms: Optional[float] = None
-    latencies_ms: List[float] = field(default_factory=list)
+    latencies_ms: Deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+    latency_sum_ms: float = 0.0
 
     def record(self, ok: bool, latency_ms: float) -> None:
         """Record one request outcome.
@@ -290,19 +329,27 @@ class Metrics:
         """
         self.total_requests += 1
         self.last_latency_ms = latency_ms
+        if len(self.latencies_ms) == self.latencies_ms.maxlen:
+            self.latency_sum_ms -= self.latencies_ms[0]
         self.latencies_ms.append(latency_ms)
+        self.latency_sum_ms += latency_ms
         if ok:
             self.success_requests += 1
         else:
             self.failed_requests += 1
 
+    def record_cache_hit(self) -> None:
+        """Record one answer served from the cache (no service request)."""
+        self.cache_hits += 1
+
     def summary(self) -> Dict[str, Any]:
         """Return metrics summary as a JSON-serializable dict."""
-        avg = (sum(self.latencies_ms) / len(self.latencies_ms)) if self.latencies_ms else None
+        avg = (self.latency_sum_ms / len(self.latencies_ms)) if self.latencies_ms else None
         return {
             "total_requests": self.total_requests,
             "success_requests": self.success_requests,
             "failed_requests": self.failed_requests,
+            "cache_hits": self.cache_hits,
             "last_latency_ms": self.last_latency_ms,
             "avg_latency_ms": avg,
             "service_base_url": SERVICE_BASE_URL,
@@ -323,8 +370,22 @@ class ExtractPersonsRequest(BaseModel):
     text: str = Field(..., min_length=1, description="Input text to run person extraction on.")
 
 
+class ExtractPersonsBatchRequest(BaseModel):
+    """Request schema for extracting person names from several texts at once."""
+    texts: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=BATCH_MAX_TEXTS,
+        description="Input texts; each one is sent to the service separately.",
+    )
+
+
 class ExtractPersonsResponse(BaseModel):
-    """Response schema expected from the external Web service."""
+    """Response schema expected from the external Web service.
+
+    Documentation only: `call_person_service` checks the reply shape itself
+    and returns the plain list, instead of building this model per request.
+    """
     persons: List[str] = Field(default_factory=list)
 
 
@@ -332,18 +393,115 @@ class ExtractPersonsResponse(BaseModel):
 # Service client
 # ----------------------------
 
-async def call_person_service(text: str) -> Tuple[ExtractPersonsResponse, float]:
+# Pedagogic error messages. Everything but the per-failure details is fixed
+# by the configuration, so they are built once here, not on every failure.
+CONNECT_ERROR_TEMPLATE = (
+    "Could not connect to the Web service.\n\n"
+    f"Checked: {SERVICE_URL}\n"
+    "Typical fixes:\n"
+    "- Start the container / service\n"
+    "- Verify port mapping (e.g., -p 8000:8000)\n"
+    "- If running remotely, check firewall / host\n\n"
+    "Technical detail: {type_name}"
+)
+TIMEOUT_ERROR = (
+    "The Web service did not respond before the timeout.\n\n"
+    f"Timeout: {SERVICE_TIMEOUT_SECONDS:.1f}s\n"
+    f"Endpoint: {SERVICE_URL}\n\n"
+    "Typical fixes:\n"
+    "- Increase PERSON_SERVICE_TIMEOUT_SECONDS\n"
+    "- Make the service faster (e.g., smaller model / caching)\n"
+    "- Check service logs for slow LLM calls"
+)
+BAD_STATUS_TEMPLATE = (
+    "The Web service returned an error.\n\n"
+    "HTTP status: {status}\n"
+    f"Endpoint: {SERVICE_URL}\n"
+    "Response body (first 500 chars):\n"
+    "{body}"
+)
+NOT_JSON_ERROR = (
+    "The Web service responded, but the response was not valid JSON.\n\n"
+    f"Endpoint: {SERVICE_URL}\n"
+    "Tip: ensure the service returns application/json with a body like:\n"
+    '{"persons": ["Name 1", "Name 2"]}'
+)
+BAD_SHAPE_TEMPLATE = (
+    "The Web service returned JSON, but not in the expected format.\n\n"
+    "Expected a JSON object with a key 'persons' holding a list of strings.\n"
+    "Example:\n"
+    '{{"persons": ["Einstein", "von Neumann"]}}\n\n'
+    "Received (first 500 chars): {received}"
+)
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# One pooled client for the whole process (created on startup, closed on
+# shutdown): repeated calls reuse a warm connection instead of opening a
+# new one per request.
+CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use."""
+    global CLIENT
+    if CLIENT is None:
+        CLIENT = httpx.AsyncClient(
+            timeout=httpx.Timeout(SERVICE_TIMEOUT_SECONDS),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0),
+            http2=SERVICE_HTTP2,
+        )
+    return CLIENT
+
+
+# Least-recently-used cache: content hash of the text -> persons list
+PERSON_CACHE: "OrderedDict[str, List[str]]" = OrderedDict()
+
+
+def cache_key(text: str) -> str:
+    """Return a short content hash of `text`, used as cache key.
+
+    Examples
+    --------
+    >>> len(cache_key("Einstein and von Neumann meet each other."))
+    32
+    """
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def cache_get(key: str) -> Optional[List[str]]:
+    """Return the cached persons for `key` (and mark it recently used), or None."""
+    persons = PERSON_CACHE.get(key)
+    if persons is not None:
+        PERSON_CACHE.move_to_end(key)
+    return persons
+
+
+def cache_put(key: str, persons: List[str]) -> None:
+    """Store `persons` for `key`, dropping the least recently used entry when full."""
+    PERSON_CACHE[key] = persons
+    PERSON_CACHE.move_to_end(key)
+    if len(PERSON_CACHE) > CACHE_SIZE:
+        PERSON_CACHE.popitem(last=False)
+
+
+async def call_person_service(text: str, from_cache: bool = True) -> Tuple[List[str], float]:
     """Call the external person-extraction service.
 
     Parameters
     ----------
     text:
         The input text.
+    from_cache:
+        When False, always call the service (a fresh answer still refreshes
+        the cache). The test suite uses this, so it measures the service as
+        it is now.
 
     Returns
     -------
-    response, latency_ms:
-        Parsed response and request latency in milliseconds.
+    persons, latency_ms:
+        Person names from the service and request latency in milliseconds
+        (0.0 when the answer came from the cache, or the text is blank).
 
     Raises
     ------
@@ -361,92 +519,65 @@ async def call_person_service(text: str) -> Tuple[ExtractPersonsResponse, float]
 
         {"persons": ["Einstein", "von Neumann"]}
     """
-    url = f"{SERVICE_BASE_URL}{SERVICE_ENDPOINT}"
+    # Whitespace-only text cannot contain a name: answer without a round-trip
+    # (not counted in the metrics, which describe calls to the service)
+    if not text.strip():
+        return [], 0.0
+
+    key = cache_key(text) if CACHE_ENABLED else None
+    if key is not None and from_cache:
+        cached = cache_get(key)
+        if cached is not None:
+            METRICS.record_cache_hit()
+            return list(cached), 0.0
+
     start = time.perf_counter()
 
-    timeout = httpx.Timeout(SERVICE_TIMEOUT_SECONDS)
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        try:
-            resp = await client.post(url, json={"text": text})
-        except httpx.ConnectError as e:
-            latency_ms = (time.perf_counter() - start) * 1000.0
-            METRICS.record(ok=False, latency_ms=latency_ms)
-            raise HTTPException(
-                status_code=502,
-                detail=(
-                    "Could not connect to the Web service.\n\n"
-                    f"Checked: {url}\n"
-                    "Typical fixes:\n"
-                    "- Start the container / service\n"
-                    "- Verify port mapping (e.g., -p 8000:8000)\n"
-                    "- If running remotely, check firewall / host\n\n"
-                    f"Technical detail: {type(e).__name__}"
-                ),
-            )
-        except httpx.ReadTimeout:
-            latency_ms = (time.perf_counter() - start) * 1000.0
-            METRICS.record(ok=False, latency_ms=latency_ms)
-            raise HTTPException(
-                status_code=504,
-                detail=(
-                    "The Web service did not respond before the timeout.\n\n"
-                    f"Timeout: {SERVICE_TIMEOUT_SECONDS:.1f}s\n"
-                    f"Endpoint: {url}\n\n"
-                    "Typical fixes:\n"
-                    "- Increase PERSON_SERVICE_TIMEOUT_SECONDS\n"
-                    "- Make the service faster (e.g., smaller model / caching)\n"
-                    "- Check service logs for slow LLM calls"
-                ),
-            )
+    try:
+        resp = await get_client().post(
+            SERVICE_URL, content=json_dumps({"text": text}), headers=JSON_HEADERS
+        )
+    except httpx.ConnectError as e:
+        latency_ms = (time.perf_counter() - start) * 1000.0
+        METRICS.record(ok=False, latency_ms=latency_ms)
+        raise HTTPException(
+            status_code=502, detail=CONNECT_ERROR_TEMPLATE.format(type_name=type(e).__name__)
+        )
+    except httpx.ReadTimeout:
+        latency_ms = (time.perf_counter() - start) * 1000.0
+        METRICS.record(ok=False, latency_ms=latency_ms)
+        raise HTTPException(status_code=504, detail=TIMEOUT_ERROR)
 
     latency_ms = (time.perf_counter() - start) * 1000.0
 
     # Pedagogic handling of non-2xx statuses
     if resp.status_code // 100 != 2:
         METRICS.record(ok=False, latency_ms=latency_ms)
+        # decode only the head we show (500 chars are at most 2000 UTF-8 bytes),
+        # not a possibly huge error page
+        body = resp.content[:2000].decode(resp.encoding or "utf-8", errors="replace")[:500]
         raise HTTPException(
             status_code=502,
-            detail=(
-                "The Web service returned an error.\n\n"
-                f"HTTP status: {resp.status_code}\n"
-                f"Endpoint: {url}\n"
-                "Response body (first 500 chars):\n"
-                f"{resp.text[:500]}"
-            ),
+            detail=BAD_STATUS_TEMPLATE.format(status=resp.status_code, body=body),
         )
 
     # Validate JSON shape
     try:
-        data = resp.json()
+        data = json_loads(resp.content)
     except ValueError:
         METRICS.record(ok=False, latency_ms=latency_ms)
-        raise HTTPException(
-            status_code=502,
-            detail=(
-                "The Web service responded, but the response was not valid JSON.\n\n"
-                f"Endpoint: {url}\n"
-                "Tip: ensure the service returns application/json with a body like:\n"
-                '{"persons": ["Name 1", "Name 2"]}'
-            ),
-        )
+        raise HTTPException(status_code=502, detail=NOT_JSON_ERROR)
 
     if not isinstance(data, dict) or "persons" not in data or not isinstance(data["persons"], list):
         METRICS.record(ok=False, latency_ms=latency_ms)
-        raise HTTPException(
-            status_code=502,
-            detail=(
-                "The Web service returned JSON, but not in the expected format.\n\n"
-                "Expected a JSON object with a key 'persons' holding a list of strings.\n"
-                "Example:\n"
-                '{"persons": ["Einstein", "von Neumann"]}\n\n'
-                f"Received (first 500 chars): {str(data)[:500]}"
-            ),
-        )
+        raise HTTPException(status_code=502, detail=BAD_SHAPE_TEMPLATE.format(received=str(data)[:500]))
 
-    # Coerce to strings (pedagogic robustness)
-    persons = [str(x) for x in data.get("persons", [])]
+    # Coerce to strings (pedagogic robustness); strings, the usual case, pass as-is
+    persons = [x if type(x) is str else str(x) for x in data["persons"]]
     METRICS.record(ok=True, latency_ms=latency_ms)
-    return ExtractPersonsResponse(persons=persons), latency_ms
+    if key is not None:
+        cache_put(key, persons)
+    return persons, latency_ms
 
 
 def normalize_person_list(xs: List[str]) -> List[str]:
@@ -457,13 +588,20 @@ def normalize_person_list(xs: List[str]) -> List[str]:
     - Strip whitespace
     - Drop empty strings
     - Keep order-insensitive comparisons outside this function
+
+    Examples
+    --------
+    >>> normalize_person_list([" Einstein ", "", "von Neumann"])
+    ['Einstein', 'von Neumann']
     """
-    out: List[str] = []
-    for x in xs:
-        y = x.strip()
-        if y:
-            out.append(y)
-    return out
+    return [y for x in xs if (y := x.strip())]
+
+
+# The dataset never changes: split it into texts / normalized expected answers
+# (plus their multiset counts for the comparison) once, not on every test run
+TEST_TEXTS: Tuple[str, ...] = tuple(ex["text"] for ex in TEST_DATASET)
+EXPECTED_PERSONS: Tuple[List[str], ...] = tuple(normalize_person_list(ex["persons"]) for ex in TEST_DATASET)
+EXPECTED_COUNTS: Tuple[Counter, ...] = tuple(Counter(persons) for persons in EXPECTED_PERSONS)
 
 
 # ----------------------------
@@ -475,11 +613,32 @@ app = FastAPI(
     description="A minimal frontend web app to demonstrate/test an external person-extraction service.",
     version="1.0.0",
 )
+# The page and /api/run-tests results are repetitive text and compress well;
+# small replies (single extraction, metrics) stay below the threshold.
+app.add_middleware(GZipMiddleware, minimum_size=512)
 
 
-@app.get("/", response_class=HTMLResponse)
-async def index() -> str:
-    """Serve the demo UI as a single HTML page (inline CSS + small JS)."""
+@app.on_event("startup")
+async def on_startup() -> None:
+    """Create the shared HTTP client."""
+    get_client()
+
+
+@app.on_event("shutdown")
+async def on_shutdown() -> None:
+    """Close the shared HTTP client and its pooled connections."""
+    global CLIENT
+    if CLIENT is not None:
+        await CLIENT.aclose()
+        CLIENT = None
+
+
+def render_index_html() -> str:
+    """Render the demo UI as a single HTML page (inline CSS + small JS).
+
+    Everything on the page is fixed at startup (configuration + dataset),
+    so it is rendered once into ``INDEX_HTML`` instead of on every request.
+    """
     # NOTE: Inline styling only (as requested). DTU-ish colors: red (153,0,0), white, black.
     return f"""<!doctype html>
 <html lang="en">
@@ -668,7 +827,8 @@ async def index() -> str:
       <section class="card">
         <h2>Small test suite</h2>
         <div class="hint">
-          Runs the built-in dataset (4 examples) by calling the external service once per example.
+          Runs the built-in dataset (4 examples) by calling the external service once per example
+          (never answered from the cache, so a changed or restarted service is really tested).
           Comparison is order-insensitive.
         </div>
         <div style="display:flex; gap:10px; flex-wrap: wrap; margin-top: 10px;">
@@ -701,6 +861,9 @@ async def index() -> str:
           <li><code>PERSON_SERVICE_URL</code> (default: <code>http://localhost:8000</code>)</li>
           <li><code>PERSON_SERVICE_ENDPOINT</code> (default: <code>/v1/extract-persons</code>)</li>
           <li><code>PERSON_SERVICE_TIMEOUT_SECONDS</code> (default: <code>10</code>)</li>
+          <li><code>PERSON_SERVICE_TEST_CONCURRENCY</code> (default: <code>16</code>)</li>
+          <li><code>PERSON_SERVICE_HTTP2</code> (default: <code>0</code>; <code>1</code> multiplexes calls over one HTTP/2 connection, needs <code>httpx[http2]</code> and an https service)</li>
+          <li><code>PERSON_SERVICE_CACHE</code> (default: <code>1</code>; <code>0</code> calls the service for every request)</li>
         </ul>
       </div>
     </section>
@@ -709,6 +872,9 @@ async def index() -> str:
   <footer>
     Minimal JS + inline CSS by design (pedagogical). If you need CORS, prefer calling the service through this frontend's
     <code>/api/*</code> endpoints (already same-origin).
+    Run with <code>python text_to_persons_ui.py</code> or <code>uvicorn text_to_persons_ui:app --port 8080</code>;
+    with <code>uvicorn[standard]</code> installed, uvicorn picks the faster <code>uvloop</code> event loop and
+    <code>httptools</code> HTTP parser automatically.
   </footer>
 
 <script>
@@ -809,7 +975,7 @@ async def index() -> str:
   }}
 
   function loadRandomTestText() {{
-    const examples = {repr([x["text"] for x in TEST_DATASET])};
+    const examples = {json.dumps([x["text"] for x in TEST_DATASET], ensure_ascii=False)};
     const text = examples[Math.floor(Math.random() * examples.length)];
     document.getElementById("textInput").value = text;
     setStatus("Loaded a random test example into the text box.", "hint");
@@ -825,77 +991,123 @@ async def index() -> str:
   document.getElementById("btnRunTests").addEventListener("click", runTests);
   document.getElementById("btnLoadExample").addEventListener("click", loadRandomTestText);
 
+  // Metrics change when this page calls the service, and those calls already
+  // refresh them. The slow poll only picks up other tabs/clients, and a
+  // hidden tab does not poll at all.
   refreshMetrics();
-  setInterval(refreshMetrics, 2500);
+  setInterval(() => {{ if (!document.hidden) refreshMetrics(); }}, 15000);
+  document.addEventListener("visibilitychange", () => {{ if (!document.hidden) refreshMetrics(); }});
 </script>
 </body>
 </html>
 """
 
 
+INDEX_HTML: bytes = render_index_html().encode("utf-8")
+
+
+@app.get("/", response_class=HTMLResponse)
+async def index() -> HTMLResponse:
+    """Serve the pre-rendered demo UI."""
+    return HTMLResponse(INDEX_HTML)
+
+
 @app.post("/api/extract-persons")
-async def api_extract_persons(req: ExtractPersonsRequest) -> JSONResponse:
+async def api_extract_persons(req: ExtractPersonsRequest) -> Response:
     """Proxy endpoint (same-origin) that calls the external service.
 
     Returns
     -------
-    JSONResponse
-        Includes a small `_meta` field with latency.
+    Response
+        JSON ``{"persons": [...]}`` plus a small `_meta` field with latency.
+        This is the most-used endpoint, so the body is encoded to JSON bytes
+        in one step here instead of going through FastAPI's response handling.
     """
-    resp, latency_ms = await call_person_service(req.text)
-    payload = {'persons': resp.persons}
+    persons, latency_ms = await call_person_service(req.text)
+    payload = {'persons': persons}
     payload["_meta"] = {"latency_ms": latency_ms}
-    return JSONResponse(payload)
+    return Response(content=json_dumps(payload), media_type="application/json")
+
+
+@app.post("/api/extract-persons-batch")
+async def api_extract_persons_batch(req: ExtractPersonsBatchRequest) -> Dict[str, Any]:
+    """Extract persons from several texts with one request from the browser.
+
+    Returns
+    -------
+    dict
+        ``{"results": [...]}`` in input order. Each item holds the text and
+        either ``persons`` + ``latency_ms`` or (if that call failed) ``error``,
+        so one failing text does not hide the others.
+
+    Notes
+    -----
+    The external service is still called once per text (it has no batch
+    endpoint), at most ``TEST_CONCURRENCY`` calls at a time.
+    """
+    sem = asyncio.Semaphore(TEST_CONCURRENCY)
+
+    async def run_one(text: str) -> Dict[str, Any]:
+        try:
+            async with sem:
+                persons, latency_ms = await call_person_service(text)
+            return {"text": text, "persons": persons, "latency_ms": latency_ms}
+        except HTTPException as e:
+            return {"text": text, "persons": None, "error": e.detail}
+
+    results = await asyncio.gather(*(run_one(t) for t in req.texts))
+    return {"results": results}
 
 
 @app.get("/api/metrics")
-async def api_metrics() -> JSONResponse:
+async def api_metrics() -> Dict[str, Any]:
     """Return in-memory operational metrics."""
-    return JSONResponse(METRICS.summary())
+    return METRICS.summary()
 
 
 @app.post("/api/run-tests")
-async def api_run_tests() -> JSONResponse:
+async def api_run_tests() -> Dict[str, Any]:
     """Run the built-in test dataset against the external service.
 
     Notes
     -----
-    - Calls the external service once per example.
+    - Calls the external service once per example, at most
+      ``TEST_CONCURRENCY`` calls at a time. The answer cache is bypassed,
+      so results and latencies always come from the service as it is now.
     - Comparison is order-insensitive.
     - This is designed for pedagogy, not for large-scale benchmarking.
     """
-    results: List[Dict[str, Any]] = []
-    passed = 0
+    sem = asyncio.Semaphore(TEST_CONCURRENCY)
 
-    for ex in TEST_DATASET:
-        text = ex["text"]
-        expected = normalize_person_list(list(ex["persons"]))
+    async def run_one(text: str, expected: List[str], expected_counts: Counter) -> Dict[str, Any]:
 
         try:
-            got_resp, latency_ms = await call_person_service(text)
-            got = normalize_person_list(got_resp.persons)
-            ok = sorted(got) == sorted(expected)
-            if ok:
-                passed += 1
-            results.append(
-                {
-                    "text": text,
-                    "expected": expected,
-                    "got": got,
-                    "pass": ok,
-                    "latency_ms": latency_ms,
-                }
-            )
+            async with sem:
+                got_persons, latency_ms = await call_person_service(text, from_cache=False)
+            got = normalize_person_list(got_persons)
+            # multiset equality: order-insensitive, duplicates still count
+            ok = Counter(got) == expected_counts
+            return {
+                "text": text,
+                "expected": expected,
+                "got": got,
+                "pass": ok,
+                "latency_ms": latency_ms,
+            }
         except HTTPException as e:
-            results.append(
-                {
-                    "text": text,
-                    "expected": expected,
-                    "got": None,
-                    "pass": False,
-                    "error": e.detail,
-                }
-            )
+            return {
+                "text": text,
+                "expected": expected,
+                "got": None,
+                "pass": False,
+                "error": e.detail,
+            }
+
+    # gather keeps the results in dataset order
+    results = await asyncio.gather(
+        *(run_one(*case) for case in zip(TEST_TEXTS, EXPECTED_PERSONS, EXPECTED_COUNTS))
+    )
+    passed = sum(r["pass"] for r in results)
 
     summary = {
         "total": len(TEST_DATASET),
@@ -903,4 +1115,12 @@ async def api_run_tests() -> JSONResponse:
         "failed": len(TEST_DATASET) - passed,
         "pass_rate": passed / len(TEST_DATASET) if TEST_DATASET else None,
     }
-    return JSONResponse({"summary": summary, "results": results})
+    return {"summary": summary, "results": results}
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # loop/http "auto" (the default) use uvloop + httptools when installed
+    # (pip install "uvicorn[standard]"), and fall back to asyncio + h11 otherwise.
+    uvicorn.run(app, host="0.0.0.0", port=8080, loop="auto", http="auto", log_level="warning")
@@ -1,11 +1,24 @@
 import asyncio
-from typing import Any, Dict, List, Optional
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple, Union
 
 import httpx
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
+
+try:
+    import orjson
+    _json_loads, _json_dumps = orjson.loads, orjson.dumps
+except ImportError:  # optional: falls back to the (slower) stdlib parser
+    _json_loads, _json_dumps = json.loads, json.dumps
 
 from wikidata_models import (
     AllResponse,
+    BatchItemResponse,
     BirthdayResponse,
     PersonRequest,
     PoliticalPartyResponse,
@@ -28,15 +41,212 @@ TIMEOUT_SECONDS = 10.0
 app = FastAPI()
 
 
+# Upper bound on names per /v1/batch call (keeps the VALUES queries reasonable)
+BATCH_MAX_PERSONS = 100
+
+# Cached Wikidata answers are reused for an hour (labels/dates rarely change)
+CACHE_TTL_SECONDS = 3600.0
+CACHE_SIZE = 4096
+
+
+class TTLCache:
+    """
+    Small in-process LRU cache whose entries also expire after ttl seconds.
+    Values are shared, not copied: callers must treat them as read-only.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._data[key]
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.hits = self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {"size": len(self._data), "maxsize": self.maxsize, "hits": self.hits, "misses": self.misses}
+
+
+SEARCH_CACHE = TTLCache(CACHE_SIZE, CACHE_TTL_SECONDS)
+SPARQL_CACHE = TTLCache(CACHE_SIZE, CACHE_TTL_SECONDS)
+RESOLVE_CACHE = TTLCache(CACHE_SIZE, CACHE_TTL_SECONDS)
+
+
+# Lookups currently on the wire: concurrent misses for the same key await the
+# first caller's result instead of each hitting Wikidata (thundering herd on a cold cache).
+_INFLIGHT: Dict[Hashable, "asyncio.Task[Any]"] = {}
+
+
+async def _singleflight(key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """Run fetch() once per key at a time; callers arriving meanwhile share its outcome."""
+    task = _INFLIGHT.get(key)
+    if task is None:
+        # the fetch runs in its own task, so it belongs to no single caller
+        task = asyncio.ensure_future(fetch())
+        _INFLIGHT[key] = task
+
+        def forget(t: "asyncio.Task[Any]") -> None:
+            if _INFLIGHT.get(key) is t:
+                del _INFLIGHT[key]
+            if not t.cancelled():
+                t.exception()  # every caller may have been cancelled: don't log it as unretrieved
+
+        task.add_done_callback(forget)
+    # shield: cancelling any caller (the first one included) leaves the shared fetch running
+    return await asyncio.shield(task)
+
+
+def _sparql_cache_key(query: str) -> bytes:
+    """Hash of the query with whitespace collapsed (indentation must not split entries)."""
+    return hashlib.blake2b(" ".join(query.split()).encode(), digest_size=16).digest()
+
+
+# Optional on-disk SPARQL cache shared by workers and kept across restarts:
+# set WIKIDATA_CACHE_DB to an SQLite file (on a volume) to enable it.
+SPARQL_DB_PATH = os.getenv("WIKIDATA_CACHE_DB")
+DISK_CACHE_TTL_SECONDS = 86400.0
+# Optional file with one person name per line, resolved in the background at startup
+WARM_NAMES_FILE = os.getenv("WIKIDATA_WARM_FILE")
+
+_DB: Optional[sqlite3.Connection] = None
+_WARM_TASK: Optional["asyncio.Task[None]"] = None
+
+
+def _open_disk_cache(path: str) -> Optional[sqlite3.Connection]:
+    try:
+        db = sqlite3.connect(path)
+        db.execute("PRAGMA journal_mode=WAL")  # readers in other workers don't block the writer
+        db.execute("CREATE TABLE IF NOT EXISTS sparql (key BLOB PRIMARY KEY, expires REAL, rows TEXT)")
+        with db:
+            db.execute("DELETE FROM sparql WHERE expires <= ?", (time.time(),))
+        return db
+    except sqlite3.Error:
+        return None
+
+
+def _disk_get(key: bytes) -> Optional[List[Dict[str, Any]]]:
+    # best effort, like the in-process cache: any SQLite problem is just a miss
+    if _DB is None:
+        return None
+    try:
+        row = _DB.execute("SELECT rows FROM sparql WHERE key = ? AND expires > ?", (key, time.time())).fetchone()
+    except sqlite3.Error:
+        return None
+    return _json_loads(row[0]) if row else None
+
+
+def _disk_put(key: bytes, rows: List[Dict[str, Any]]) -> None:
+    if _DB is None:
+        return
+    try:
+        with _DB:
+            _DB.execute(
+                "INSERT OR REPLACE INTO sparql VALUES (?, ?, ?)",
+                (key, time.time() + DISK_CACHE_TTL_SECONDS, _json_dumps(rows)),
+            )
+    except sqlite3.Error:
+        pass
+
+
+def _disk_clear() -> None:
+    if _DB is None:
+        return
+    try:
+        with _DB:
+            _DB.execute("DELETE FROM sparql")
+    except sqlite3.Error:
+        pass
+
+
 # ----------------------------
 # HTTP helpers
 # ----------------------------
 
+# One pooled client for the whole app: keep-alive connections to wikidata.org
+# and query.wikidata.org are reused instead of paying TCP + TLS per lookup.
+CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use."""
+    global CLIENT
+    if CLIENT is None:
+        CLIENT = httpx.AsyncClient(
+            timeout=TIMEOUT_SECONDS,
+            headers={"User-Agent": USER_AGENT},
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+    return CLIENT
+
+
+async def _warm_cache(path: str) -> None:
+    """Resolve the names listed in path one by one, so they are cached before first use."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            names = [line.strip() for line in f if line.strip()]
+    except OSError:
+        return
+    for name in names:
+        try:
+            await resolve_person(name)
+        except (HTTPException, httpx.HTTPError):
+            continue
+
+
+@app.on_event("startup")
+async def on_startup() -> None:
+    global _DB, _WARM_TASK
+    get_client()
+    if SPARQL_DB_PATH:
+        _DB = _open_disk_cache(SPARQL_DB_PATH)
+    if WARM_NAMES_FILE:
+        _WARM_TASK = asyncio.create_task(_warm_cache(WARM_NAMES_FILE))
+
+
+@app.on_event("shutdown")
+async def on_shutdown() -> None:
+    global CLIENT, _DB, _WARM_TASK
+    if _WARM_TASK is not None:
+        _WARM_TASK.cancel()
+        _WARM_TASK = None
+    if CLIENT is not None:
+        await CLIENT.aclose()
+        CLIENT = None
+    if _DB is not None:
+        _DB.close()
+        _DB = None
+
+
 async def _wikidata_search(name: str, language: str, limit: int = 10) -> List[Dict[str, Any]]:
     """
     Entity search via Wikidata API (wbsearchentities).
     We use it for entity linking: given a name string -> candidate QIDs.
     """
+    key = (name, language, limit)
+    cached = SEARCH_CACHE.get(key)
+    if cached is not None:
+        return cached
+
     params = {
         "action": "wbsearchentities",
         "search": name,
@@ -45,34 +255,48 @@ async def _wikidata_search(name: str, language: str, limit: int = 10) -> List[Di
         "type": "item",
         "limit": limit,
     }
-    headers = {"User-Agent": USER_AGENT}
-
-    async with httpx.AsyncClient(timeout=TIMEOUT_SECONDS, headers=headers) as client:
-        resp = await client.get(WIKIDATA_SEARCH_URL, params=params)
+    resp = await get_client().get(WIKIDATA_SEARCH_URL, params=params)
 
     if resp.status_code != 200:
         raise HTTPException(status_code=502, detail=f"Wikidata search failed: {resp.status_code}")
 
-    return resp.json().get("search") or []
+    results = _json_loads(resp.content).get("search") or []
+    SEARCH_CACHE.put(key, results)
+    return results
 
 
 async def _sparql_select(query: str) -> List[Dict[str, Any]]:
     """
     Run a SPARQL SELECT query and return the binding rows.
     """
-    headers = {"Accept": "application/sparql+json", "User-Agent": USER_AGENT}
-    async with httpx.AsyncClient(timeout=TIMEOUT_SECONDS, headers=headers) as client:
-        resp = await client.get(
-            WIKIDATA_SPARQL_URL,
-            params={"query": query, "format": "json"},
-            headers=headers,
-        )
+    key = _sparql_cache_key(query)
+    cached = SPARQL_CACHE.get(key)
+    if cached is None:
+        cached = _disk_get(key)
+        if cached is not None:
+            SPARQL_CACHE.put(key, cached)
+    if cached is not None:
+        return cached
+    return await _singleflight(("sparql", key), lambda: _sparql_fetch(query, key))
+
+
+async def _sparql_fetch(query: str, key: bytes) -> List[Dict[str, Any]]:
+    # POST form body: long VALUES queries stay out of the URL.
+    # httpx already sends Accept-Encoding: gzip, so JSON bindings come back compressed.
+    resp = await get_client().post(
+        WIKIDATA_SPARQL_URL,
+        data={"query": query, "format": "json"},
+        headers={"Accept": "application/sparql-results+json"},
+    )
 
     if resp.status_code != 200:
         snippet = (resp.text or "")[:200]
         raise HTTPException(status_code=502, detail=f"Wikidata SPARQL failed: {resp.status_code} {snippet}")
 
-    return resp.json().get("results", {}).get("bindings", [])
+    rows = _json_loads(resp.content).get("results", {}).get("bindings", [])
+    SPARQL_CACHE.put(key, rows)
+    _disk_put(key, rows)
+    return rows
 
 
 def _qid_from_uri(uri: str) -> str:
@@ -98,19 +322,61 @@ def _normalize_date(value: str) -> Optional[str]:
 # ----------------------------
 # Entity linking (simple + robust)
 # ----------------------------
+# SPARQL queries are module-level str.format templates (literal braces doubled),
+# so only the QID/VALUES part is filled in per request.
 
 async def _search_candidates(person: str) -> List[Dict[str, Any]]:
     """
     Search candidates with language fallback.
     It tries English first, then Danish, then auto language.
+    The three searches run concurrently; the results are still taken in that order.
     """
-    for lang in ("en", "da", "auto"):
-        res = await _wikidata_search(person, language=lang, limit=20)
+    results = await asyncio.gather(
+        *(_wikidata_search(person, language=lang, limit=20) for lang in ("en", "da", "auto")),
+        return_exceptions=True,
+    )
+    for res in results:
+        if isinstance(res, BaseException):
+            raise res
         if res:
             return res
     return []
 
 
+# Important: I used EXISTS(...) for booleans so the variable is always present.
+_Q_ENRICH = """
+SELECT ?item ?itemLabel ?sitelinks
+       (EXISTS {{ ?item wdt:P31 wd:Q5 }} AS ?isHuman)
+       (EXISTS {{ ?item wdt:P569 ?dob }} AS ?hasDob)
+       (EXISTS {{ ?item wdt:P27 wd:Q35 }} AS ?isDanish)
+       ?dob
+WHERE {{
+  VALUES ?item {{ {values} }}
+  OPTIONAL {{ ?item wikibase:sitelinks ?sitelinks . }}
+  OPTIONAL {{ ?item wdt:P569 ?dob . }}
+  SERVICE wikibase:label {{ bd:serviceParam wikibase:language "en". }}
+}}
+"""
+
+
+# Fast path: only humans with a DOB, the candidates resolve_person keeps anyway
+# whenever there is at least one. Constant flags keep the row shape of _Q_ENRICH.
+_Q_ENRICH_STRICT = """
+SELECT ?item ?itemLabel ?sitelinks
+       (true AS ?isHuman)
+       (true AS ?hasDob)
+       (EXISTS {{ ?item wdt:P27 wd:Q35 }} AS ?isDanish)
+       ?dob
+WHERE {{
+  VALUES ?item {{ {values} }}
+  ?item wdt:P31 wd:Q5 ;
+        wdt:P569 ?dob .
+  OPTIONAL {{ ?item wikibase:sitelinks ?sitelinks . }}
+  SERVICE wikibase:label {{ bd:serviceParam wikibase:language "en". }}
+}}
+"""
+
+
 async def _enrich_candidates(qids: List[str]) -> List[Dict[str, Any]]:
     """
     Enrich candidate QIDs with features used for disambiguation:
@@ -119,27 +385,20 @@ async def _enrich_candidates(qids: List[str]) -> List[Dict[str, Any]]:
     - isDanish: country of citizenship Denmark (Q35) (helpful for DK-heavy gold set)
     - sitelinks: popularity proxy (how many Wikipedia sitelinks)
      also pull one DOB value (optional).
+    The strict query (humans with DOB only) is tried first; the permissive one
+    runs only when none of the candidates passes it.
     """
+    return await _enrich_rows(_Q_ENRICH_STRICT, qids) or await _enrich_rows(_Q_ENRICH, qids)
+
+
+async def _enrich_rows(template: str, qids: List[str]) -> List[Dict[str, Any]]:
+    """Run one enrichment template over the QIDs and turn the rows into candidate dicts."""
     if not qids:
         return []
 
-    values = " ".join(f"wd:{q}" for q in qids)
-
-    # Important: I used EXISTS(...) for booleans so the variable is always present.
-    query = f"""
-    SELECT ?item ?itemLabel ?sitelinks
-           (EXISTS {{ ?item wdt:P31 wd:Q5 }} AS ?isHuman)
-           (EXISTS {{ ?item wdt:P569 ?dob }} AS ?hasDob)
-           (EXISTS {{ ?item wdt:P27 wd:Q35 }} AS ?isDanish)
-           ?dob
-    WHERE {{
-      VALUES ?item {{ {values} }}
-      OPTIONAL {{ ?item wikibase:sitelinks ?sitelinks . }}
-      OPTIONAL {{ ?item wdt:P569 ?dob . }}
-      SERVICE wikibase:label {{ bd:serviceParam wikibase:language "en". }}
-    }}
-    """
-    rows = await _sparql_select(query)
+    values = " ".join(map("wd:{}".format, qids))
+
+    rows = await _sparql_select(template.format(values=values))
 
     out: List[Dict[str, Any]] = []
     for r in rows:
@@ -178,11 +437,79 @@ async def resolve_person(person: str, context: Optional[str] = None) -> Dict[str
     Input: person string (possibly incomplete) + optional context.
     Output: {"qid": "...", "label": "..."} using EN label as canonical output.
     """
+    cached = RESOLVE_CACHE.get(person)
+    if cached is not None:
+        return dict(cached)
+
+    async def fetch() -> Dict[str, str]:
+        resolved = await _resolve_person_uncached(person)
+        RESOLVE_CACHE.put(person, dict(resolved))
+        return resolved
+
+    return dict(await _singleflight(("resolve", person), fetch))
+
+
+async def _resolve_person_uncached(person: str) -> Dict[str, str]:
     candidates = await _search_candidates(person)
     if not candidates:
         raise HTTPException(status_code=404, detail="No matching Wikidata entity found")
 
-    # Take top-k unique QIDs from search results to avoid duplicates
+    enriched = await _enrich_candidates(_top_qids(candidates))
+    return _pick_candidate(person, candidates, enriched)
+
+
+async def resolve_persons(persons: List[str]) -> Dict[str, Union[Dict[str, str], str]]:
+    """
+    Resolve several names at once (used by /v1/batch).
+    Searches run concurrently and all candidates are enriched with ONE strict SPARQL query
+    (plus one permissive query for the names it leaves without a candidate).
+    Output maps each name to {"qid", "label"}, or to an error message when nothing
+    matched or its search failed (one name's failure does not fail the others).
+    """
+    resolved: Dict[str, Union[Dict[str, str], str]] = {}
+    todo: List[str] = []
+    for person in dict.fromkeys(persons):
+        cached = RESOLVE_CACHE.get(person)
+        if cached is not None:
+            resolved[person] = dict(cached)
+        else:
+            todo.append(person)
+    if not todo:
+        return resolved
+
+    found = await asyncio.gather(*(_search_candidates(person) for person in todo), return_exceptions=True)
+    searched: Dict[str, List[Dict[str, Any]]] = {}
+    for person, candidates in zip(todo, found):
+        # failures become this item's error and are not cached
+        if isinstance(candidates, HTTPException):
+            resolved[person] = candidates.detail
+        elif isinstance(candidates, httpx.HTTPError):
+            resolved[person] = f"Wikidata search failed: {candidates!r}"
+        elif isinstance(candidates, BaseException):
+            raise candidates
+        elif not candidates:
+            resolved[person] = "No matching Wikidata entity found"
+        else:
+            searched[person] = candidates
+
+    top = {person: _top_qids(candidates) for person, candidates in searched.items()}
+    enriched = await _enrich_rows(_Q_ENRICH_STRICT, list(dict.fromkeys(q for qids in top.values() for q in qids)))
+    # names without any human-with-DOB candidate fall back to the permissive query, as in resolve_person
+    strict_hits = {c["qid"] for c in enriched}
+    loose = [q for qids in top.values() if strict_hits.isdisjoint(qids) for q in qids]
+    if loose:
+        enriched += await _enrich_rows(_Q_ENRICH, list(dict.fromkeys(loose)))
+
+    for person, candidates in searched.items():
+        wanted = set(top[person])
+        best = _pick_candidate(person, candidates, [c for c in enriched if c["qid"] in wanted])
+        RESOLVE_CACHE.put(person, dict(best))
+        resolved[person] = best
+    return resolved
+
+
+def _top_qids(candidates: List[Dict[str, Any]]) -> List[str]:
+    """Take top-k unique QIDs from search results to avoid duplicates."""
     seen = set()
     qids: List[str] = []
     for c in candidates:
@@ -192,8 +519,13 @@ async def resolve_person(person: str, context: Optional[str] = None) -> Dict[str
             qids.append(q)
         if len(qids) >= 12:
             break
+    return qids
+
 
-    enriched = await _enrich_candidates(qids)
+def _pick_candidate(
+    person: str, candidates: List[Dict[str, Any]], enriched: List[Dict[str, Any]]
+) -> Dict[str, str]:
+    """Choose the best enriched candidate for the name (search order as fallback)."""
     if not enriched:
         # SPARQL enrichment failed -> fallback: return the best search candidate
         top = candidates[0]
@@ -210,31 +542,26 @@ async def resolve_person(person: str, context: Optional[str] = None) -> Dict[str
     if pool2:
         pool = pool2
 
+    # weights that depend only on the query are fixed once, not per candidate
+    danish_weight = 80.0 if is_short else 0.0
+
     def score(c: Dict[str, Any]) -> float:
         """
         Simple scoring model:
         - human and DOB are strong signals
         - for single-token queries, Danish bias helps on the course gold set
-        - sitelinks improves "famous person" selection
+        - sitelinks improves "famous person" selection (popularity proxy)
+        - lexical containment: query token occurs in label
+        _enrich_candidates always sets these keys, so plain indexing is enough.
         """
-        s = 0.0
-        s += 1000.0 * c.get("is_human", 0)
-        s += 300.0 * c.get("has_dob", 0)
-
-        if is_short:
-            s += 80.0 * c.get("is_danish", 0)
-
-        # lexical containment: query token occurs in label
-        lab = (c.get("label") or "").lower()
-        if token and token in lab:
+        s = (1000.0 * c["is_human"] + 300.0 * c["has_dob"]
+             + danish_weight * c["is_danish"] + 0.5 * c["sitelinks"])
+        if token and token in c["label"].lower():
             s += 10.0
-
-        # popularity proxy
-        s += 0.5 * c.get("sitelinks", 0)
         return s
 
-    pool.sort(key=score, reverse=True)
-    best = pool[0]
+    # only the top candidate is used; max() keeps the first on ties, like the stable sort did
+    best = max(pool, key=score)
 
     # output EN label for stable/canonical person field (matches tester expectation better)
     label = best.get("label") or person
@@ -245,18 +572,24 @@ async def resolve_person(person: str, context: Optional[str] = None) -> Dict[str
 # Wikidata lookups
 # ----------------------------
 
+_Q_BIRTHDAY = """
+SELECT ?dob WHERE {{
+  wd:{qid} wdt:P569 ?dob .
+}} LIMIT 10
+"""
+
+
 async def get_birthday(qid: str) -> Optional[str]:
     """
     P569 = date of birth
     return 'YYYY-MM-DD' when possible.
     """
-    query = f"""
-    SELECT ?dob WHERE {{
-      wd:{qid} wdt:P569 ?dob .
-    }} LIMIT 10
-    """
-    rows = await _sparql_select(query)
+    rows = await _sparql_select(_Q_BIRTHDAY.format(qid=qid))
+    return _birthday_from_rows(rows)
+
 
+def _birthday_from_rows(rows: List[Dict[str, Any]]) -> Optional[str]:
+    """Pick the birthday from rows binding ?dob (rows without it are skipped)."""
     dates: List[str] = []
     for r in rows:
         v = r.get("dob", {}).get("value")
@@ -273,6 +606,14 @@ async def get_birthday(qid: str) -> Optional[str]:
     return dates[0]
 
 
+_Q_STUDENTS = """
+SELECT ?student ?studentLabel WHERE {{
+  wd:{qid} (wdt:P185|wdt:P802|^wdt:P184|^wdt:P1066) ?student .
+  SERVICE wikibase:label {{ bd:serviceParam wikibase:language "en,da". }}
+}}
+"""
+
+
 async def get_students(qid: str) -> List[Dict[str, str]]:
     """
     Student relations are tricky on Wikidata, so we use a property path:
@@ -282,14 +623,12 @@ async def get_students(qid: str) -> List[Dict[str, str]]:
     - ^P1066: inverse of student of
     dedup done in Python preserving the returned order (important for strict tests).
     """
-    query = f"""
-    SELECT ?student ?studentLabel WHERE {{
-      wd:{qid} (wdt:P185|wdt:P802|^wdt:P184|^wdt:P1066) ?student .
-      SERVICE wikibase:label {{ bd:serviceParam wikibase:language "en,da". }}
-    }}
-    """
-    rows = await _sparql_select(query)
+    rows = await _sparql_select(_Q_STUDENTS.format(qid=qid))
+    return _students_from_rows(rows)
+
 
+def _students_from_rows(rows: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+    """Dedup the rows binding ?student (rows without it are skipped), keeping their order."""
     out: List[Dict[str, str]] = []
     seen: set[str] = set()
 
@@ -309,15 +648,85 @@ async def get_students(qid: str) -> List[Dict[str, str]]:
     return out
 
 
+_Q_BIRTHDAY_AND_STUDENTS = """
+SELECT ?dob ?student ?studentLabel WHERE {{
+  {{
+    wd:{qid} wdt:P569 ?dob .
+  }}
+  UNION
+  {{
+    wd:{qid} (wdt:P185|wdt:P802|^wdt:P184|^wdt:P1066) ?student .
+  }}
+  SERVICE wikibase:label {{ bd:serviceParam wikibase:language "en,da". }}
+}}
+"""
+
+
+async def get_birthday_and_students(qid: str) -> Tuple[Optional[str], List[Dict[str, str]]]:
+    """
+    Birthday and students in one SPARQL round trip (used by /v1/all).
+    The UNION keeps the two patterns apart, so rows bind either ?dob or ?student
+    and there is no DOB x student cross product. Same properties and label
+    languages as get_birthday / get_students.
+    If the combined query fails, fall back to the two single-field queries.
+    """
+    try:
+        rows = await _sparql_select(_Q_BIRTHDAY_AND_STUDENTS.format(qid=qid))
+    except (HTTPException, httpx.HTTPError):
+        dob, students_list = await asyncio.gather(get_birthday(qid), get_students(qid))
+        return dob, students_list
+    return _birthday_from_rows(rows), _students_from_rows(rows)
+
+
+_Q_BIRTHDAYS_AND_STUDENTS = """
+SELECT ?person ?dob ?student ?studentLabel WHERE {{
+  VALUES ?person {{ {values} }}
+  {{
+    ?person wdt:P569 ?dob .
+  }}
+  UNION
+  {{
+    ?person (wdt:P185|wdt:P802|^wdt:P184|^wdt:P1066) ?student .
+  }}
+  SERVICE wikibase:label {{ bd:serviceParam wikibase:language "en,da". }}
+}}
+"""
+
+
+async def get_birthdays_and_students(qids: List[str]) -> Dict[str, Tuple[Optional[str], List[Dict[str, str]]]]:
+    """
+    Batch version of get_birthday_and_students: one VALUES query for all QIDs.
+    Output maps each QID to (birthday, students).
+    """
+    if not qids:
+        return {}
+
+    values = " ".join(map("wd:{}".format, qids))
+    try:
+        rows = await _sparql_select(_Q_BIRTHDAYS_AND_STUDENTS.format(values=values))
+    except (HTTPException, httpx.HTTPError):
+        facts = await asyncio.gather(*(get_birthday_and_students(q) for q in qids))
+        return dict(zip(qids, facts))
+
+    by_qid: Dict[str, List[Dict[str, Any]]] = {q: [] for q in qids}
+    for r in rows:
+        uri = r.get("person", {}).get("value")
+        if uri:
+            by_qid.setdefault(_qid_from_uri(uri), []).append(r)
+    return {q: (_birthday_from_rows(rs), _students_from_rows(rs)) for q, rs in by_qid.items()}
+
+
+_Q_POLITICAL_PARTY = """
+SELECT ?party ?partyLabel WHERE {{
+  wd:{qid} wdt:P102 ?party .
+  SERVICE wikibase:label {{ bd:serviceParam wikibase:language "en". }}
+}}
+"""
+
+
 async def get_political_party(qid: str) -> List[Dict[str, str]]:
     """P102 = member of political party."""
-    query = f"""
-    SELECT ?party ?partyLabel WHERE {{
-      wd:{qid} wdt:P102 ?party .
-      SERVICE wikibase:label {{ bd:serviceParam wikibase:language "en". }}
-    }}
-    """
-    rows = await _sparql_select(query)
+    rows = await _sparql_select(_Q_POLITICAL_PARTY.format(qid=qid))
 
     out: List[Dict[str, str]] = []
     for r in rows:
@@ -330,25 +739,27 @@ async def get_political_party(qid: str) -> List[Dict[str, str]]:
     return out
 
 
+_Q_SUPERVISORS = """
+SELECT DISTINCT ?supervisor ?supervisorLabel WHERE {{
+  {{
+    wd:{qid} wdt:P184 ?supervisor .
+  }}
+  UNION
+  {{
+    wd:{qid} wdt:P1066 ?supervisor .
+  }}
+  SERVICE wikibase:label {{ bd:serviceParam wikibase:language "en". }}
+}}
+"""
+
+
 async def get_supervisors(qid: str) -> List[Dict[str, str]]:
     """
     Supervisor/advisor-ish relations:
     - P184: doctoral advisor
     - P1066: student of
     """
-    query = f"""
-    SELECT DISTINCT ?supervisor ?supervisorLabel WHERE {{
-      {{
-        wd:{qid} wdt:P184 ?supervisor .
-      }}
-      UNION
-      {{
-        wd:{qid} wdt:P1066 ?supervisor .
-      }}
-      SERVICE wikibase:label {{ bd:serviceParam wikibase:language "en". }}
-    }}
-    """
-    rows = await _sparql_select(query)
+    rows = await _sparql_select(_Q_SUPERVISORS.format(qid=qid))
 
     out: List[Dict[str, str]] = []
     for r in rows:
@@ -361,45 +772,165 @@ async def get_supervisors(qid: str) -> List[Dict[str, str]]:
     return out
 
 
+# ----------------------------
+# HTTP caching
+# ----------------------------
+
+# Answers are safe to reuse as long as our own cache keeps them; a proxy may serve
+# a stale copy for a day while it revalidates in the background.
+CACHE_CONTROL = f"public, max-age={int(CACHE_TTL_SECONDS)}, stale-while-revalidate=86400"
+
+READ_PATHS = frozenset({
+    "/v1/birthday", "/v1/students", "/v1/all", "/v1/political-party", "/v1/supervisor",
+})
+
+
+@app.middleware("http")
+async def http_cache_headers(request: Request, call_next):
+    """
+    Add Cache-Control and an ETag (hash of the JSON body) to successful GET
+    lookups, and answer 304 when the client already holds that body
+    (If-None-Match). POST lookups pass through untouched: a 304 is only
+    defined for GET/HEAD, and caches do not store POST responses anyway.
+    """
+    response = await call_next(request)
+    if (
+        request.method not in ("GET", "HEAD")
+        or request.url.path not in READ_PATHS
+        or response.status_code != 200
+    ):
+        return response
+
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    etag = '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+    cache_headers = {"Cache-Control": CACHE_CONTROL, "ETag": etag}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in (t.strip() for t in if_none_match.split(",")):
+        return Response(status_code=304, headers=cache_headers)
+    headers = dict(response.headers)
+    headers.update(cache_headers)
+    return Response(content=body, status_code=response.status_code, headers=headers)
+
+
 # ----------------------------
 # API endpoints
 # ----------------------------
 
-@app.post("/v1/birthday", response_model=BirthdayResponse)
+@app.get("/v1/cache/stats")
+async def cache_stats() -> Dict[str, Any]:
+    return {
+        "search": SEARCH_CACHE.stats(),
+        "sparql": SPARQL_CACHE.stats(),
+        "resolve": RESOLVE_CACHE.stats(),
+    }
+
+
+@app.post("/v1/cache/clear")
+async def cache_clear() -> Dict[str, bool]:
+    for cache in (SEARCH_CACHE, SPARQL_CACHE, RESOLVE_CACHE):
+        cache.clear()
+    _disk_clear()
+    return {"cleared": True}
+
+
+# The handlers build exactly the documented shapes, so they return pre-encoded
+# JSON and skip FastAPI's per-response model validation; the models stay in the
+# OpenAPI docs through `responses=`.
+
+def _documented(model: Any) -> Dict[int, Dict[str, Any]]:
+    return {200: {"model": model}}
+
+
+def _json_response(payload: Any) -> Response:
+    return Response(content=_json_dumps(payload), media_type="application/json")
+
+
+@app.post("/v1/birthday", response_model=None, responses=_documented(BirthdayResponse))
 async def birthday(req: PersonRequest):
     # Resolve name -> best QID, then lookup birthday for that QID
     resolved = await resolve_person(req.person, context=req.context)
     dob = await get_birthday(resolved["qid"])
-    return {"person": resolved["label"], "qid": resolved["qid"], "birthday": dob}
+    return _json_response({"person": resolved["label"], "qid": resolved["qid"], "birthday": dob})
 
 
-@app.post("/v1/students", response_model=StudentsResponse)
+@app.post("/v1/students", response_model=None, responses=_documented(StudentsResponse))
 async def students(req: PersonRequest):
     resolved = await resolve_person(req.person, context=req.context)
     students_list = await get_students(resolved["qid"])
-    return {"person": resolved["label"], "qid": resolved["qid"], "students": students_list}
+    return _json_response({"person": resolved["label"], "qid": resolved["qid"], "students": students_list})
 
 
-@app.post("/v1/all", response_model=AllResponse)
+@app.post("/v1/all", response_model=None, responses=_documented(AllResponse))
 async def all_info(req: PersonRequest):
-    # Run birthday + students in parallel to reduce latency
+    # Birthday + students come back from a single SPARQL query
     resolved = await resolve_person(req.person, context=req.context)
-    dob, students_list = await asyncio.gather(
-        get_birthday(resolved["qid"]),
-        get_students(resolved["qid"]),
+    dob, students_list = await get_birthday_and_students(resolved["qid"])
+    return _json_response({
+        "person": resolved["label"], "qid": resolved["qid"], "birthday": dob, "students": students_list,
+    })
+
+
+@app.post("/v1/batch", response_model=None, responses=_documented(List[BatchItemResponse]))
+async def batch_all(reqs: List[PersonRequest]):
+    # Same fields as /v1/all for many names; the list is aligned to the input order
+    if len(reqs) > BATCH_MAX_PERSONS:
+        raise HTTPException(status_code=422, detail=f"At most {BATCH_MAX_PERSONS} persons per batch")
+    resolved = await resolve_persons([r.person for r in reqs])
+    facts = await get_birthdays_and_students(
+        list(dict.fromkeys(r["qid"] for r in resolved.values() if not isinstance(r, str)))
     )
-    return {"person": resolved["label"], "qid": resolved["qid"], "birthday": dob, "students": students_list}
 
+    out: List[Dict[str, Any]] = []
+    for req in reqs:
+        res = resolved[req.person]
+        if isinstance(res, str):
+            out.append({"person": req.person, "qid": None, "birthday": None, "students": [], "error": res})
+            continue
+        dob, students_list = facts.get(res["qid"], (None, []))
+        out.append({
+            "person": res["label"], "qid": res["qid"], "birthday": dob, "students": students_list, "error": None,
+        })
+    return _json_response(out)
 
-@app.post("/v1/political-party", response_model=PoliticalPartyResponse)
+
+@app.post("/v1/political-party", response_model=None, responses=_documented(PoliticalPartyResponse))
 async def political_party(req: PersonRequest):
     resolved = await resolve_person(req.person, context=req.context)
     parties = await get_political_party(resolved["qid"])
-    return {"person": resolved["label"], "qid": resolved["qid"], "political_party": parties}
+    return _json_response({"person": resolved["label"], "qid": resolved["qid"], "political_party": parties})
 
 
-@app.post("/v1/supervisor", response_model=SupervisorResponse)
+@app.post("/v1/supervisor", response_model=None, responses=_documented(SupervisorResponse))
 async def supervisor(req: PersonRequest):
     resolved = await resolve_person(req.person, context=req.context)
     supervisors = await get_supervisors(resolved["qid"])
-    return {"person": resolved["label"], "qid": resolved["qid"], "supervisors": supervisors}
\ No newline at end of file
+    return _json_response({"person": resolved["label"], "qid": resolved["qid"], "supervisors": supervisors})
+
+
+# GET aliases (person/context as query parameters) so HTTP caches and CDNs,
+# which only store GET responses, can serve repeated lookups.
+
+@app.get("/v1/birthday", response_model=None, responses=_documented(BirthdayResponse))
+async def birthday_get(person: str, context: Optional[str] = None):
+    return await birthday(PersonRequest(person=person, context=context))
+
+
+@app.get("/v1/students", response_model=None, responses=_documented(StudentsResponse))
+async def students_get(person: str, context: Optional[str] = None):
+    return await students(PersonRequest(person=person, context=context))
+
+
+@app.get("/v1/all", response_model=None, responses=_documented(AllResponse))
+async def all_info_get(person: str, context: Optional[str] = None):
+    return await all_info(PersonRequest(person=person, context=context))
+
+
+@app.get("/v1/political-party", response_model=None, responses=_documented(PoliticalPartyResponse))
+async def political_party_get(person: str, context: Optional[str] = None):
+    return await political_party(PersonRequest(person=person, context=context))
+
+
+@app.get("/v1/supervisor", response_model=None, responses=_documented(SupervisorResponse))
+async def supervisor_get(person: str, context: Optional[str] = None):
+    return await supervisor(PersonRequest(person=person, context=context))
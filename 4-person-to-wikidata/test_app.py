@@ -0,0 +1,43 @@
+from fastapi.testclient import TestClient
+
+import app as wikidata_app
+
+
+client = TestClient(wikidata_app.app)
+
+
+def _fake_lookups(monkeypatch):
+    async def fake_resolve_person(person, context=None):
+        return {"label": "Niels Bohr", "qid": "Q7085"}
+
+    async def fake_get_birthday(qid):
+        return "1885-10-07"
+
+    monkeypatch.setattr(wikidata_app, "resolve_person", fake_resolve_person)
+    monkeypatch.setattr(wikidata_app, "get_birthday", fake_get_birthday)
+
+
+def test_get_lookup_answers_304_for_a_matching_etag(monkeypatch):
+    _fake_lookups(monkeypatch)
+
+    first = client.get("/v1/birthday", params={"person": "Niels Bohr"})
+    assert first.status_code == 200
+    assert first.json() == {"person": "Niels Bohr", "qid": "Q7085", "birthday": "1885-10-07"}
+    etag = first.headers["etag"]
+    assert "max-age" in first.headers["cache-control"]
+
+    again = client.get("/v1/birthday", params={"person": "Niels Bohr"}, headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+
+
+def test_post_lookup_ignores_if_none_match(monkeypatch):
+    _fake_lookups(monkeypatch)
+
+    etag = client.get("/v1/birthday", params={"person": "Niels Bohr"}).headers["etag"]
+
+    response = client.post("/v1/birthday", json={"person": "Niels Bohr"}, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json() == {"person": "Niels Bohr", "qid": "Q7085", "birthday": "1885-10-07"}
+    assert "etag" not in response.headers
+    assert "cache-control" not in response.headers
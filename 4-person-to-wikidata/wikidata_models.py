@@ -38,3 +38,11 @@ class AllResponse(BaseModel):
     qid: str
     birthday: Optional[str] = None
     students: List[Dict[str, str]]
+
+
+class BatchItemResponse(BaseModel):
+    person: str
+    qid: Optional[str] = None
+    birthday: Optional[str] = None
+    students: List[Dict[str, str]] = Field(default_factory=list)
+    error: Optional[str] = None